@@ -396,7 +396,10 @@ class AudioHandler:
             self._cleanup_temp_file()
     
     def get_audio_level(self) -> float:
-        """Get current audio level (0-100) - optimized with persistent stream"""
+        """Get current audio level (0-100) - optimized with persistent stream
+
+        Raises OSError if the input device can't be opened or read.
+        """
         if self.is_muted:
             return 0.0
         
@@ -404,6 +407,8 @@ class AudioHandler:
             # Create persistent stream if needed
             if not self.level_stream:
                 self._create_level_stream()
+                if not self.level_stream:
+                    raise OSError("level stream unavailable")
             
             if self.level_stream:
                 data = self.level_stream.read(self.chunk, exception_on_overflow=False)
@@ -423,7 +428,7 @@ class AudioHandler:
         except (OSError, IOError) as e:
             print(f"Audio level error: {e}")
             self._reset_level_stream()
-            return 0.0
+            raise  # Caller backs off while the device keeps failing
     
     def _create_level_stream(self):
         """Create persistent audio stream for level monitoring"""
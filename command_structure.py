@@ -5,13 +5,15 @@
 
 from typing import List, Dict, Any, Optional
 import pyautogui
+import pyperclip
+import ctypes
 import time
 import os
 try:
     import win32gui  # Windows-only; guarded for cross-platform use
 except ImportError:
     win32gui = None
-from text_normalizer import text_normalizer
+from text_normalizer import get_text_normalizer
 
 
 class CommandParser:
@@ -20,7 +22,11 @@ class CommandParser:
     def __init__(self):
         self.enabled = False  # Commands disabled for now
         self.command_patterns = {}  # Future: command definitions
-        self.text_normalizer = text_normalizer  # Use the global text normalizer
+    
+    @property
+    def text_normalizer(self):
+        """The global text normalizer (built on first use, not at startup)"""
+        return get_text_normalizer()
     
     # Single-word command tokens mapped to key presses
     COMMAND_WORDS = {
@@ -65,6 +71,8 @@ class CommandParser:
         raw_tokens = normalized_text.split()
         tokens = [t.rstrip(".,!?;:") for t in raw_tokens]
 
+        # Commands are collected tail-first and reversed once at the end;
+        # tokens are trimmed in place rather than re-sliced per command
         commands: List[str] = []
         while tokens:
             last = tokens[-1].lower()
@@ -72,27 +80,28 @@ class CommandParser:
 
             # Modifier + key (e.g. "control c", "alt tab")
             if prev in self.MODIFIERS:
-                key = last
-                if key in self.COMMAND_WORDS:
-                    key = self.COMMAND_WORDS[key]
-                commands.insert(0, f"key:{self.MODIFIERS[prev]}+{key}")
-                tokens = tokens[:-2]
+                key = self.COMMAND_WORDS.get(last, last)
+                commands.append(f"key:{self.MODIFIERS[prev]}+{key}")
+                del tokens[-2:]
                 continue
 
             # Two-word phrase (e.g. "new line")
-            if prev and (prev, last) in self.COMMAND_PHRASES:
-                commands.insert(0, f"key:{self.COMMAND_PHRASES[(prev, last)]}")
-                tokens = tokens[:-2]
+            phrase = self.COMMAND_PHRASES.get((prev, last)) if prev else None
+            if phrase is not None:
+                commands.append(f"key:{phrase}")
+                del tokens[-2:]
                 continue
 
             # Single-word command
-            if last in self.COMMAND_WORDS:
-                commands.insert(0, f"key:{self.COMMAND_WORDS[last]}")
-                tokens = tokens[:-1]
+            word = self.COMMAND_WORDS.get(last)
+            if word is not None:
+                commands.append(f"key:{word}")
+                del tokens[-1]
                 continue
 
             break  # no more trailing commands
 
+        commands.reverse()
         clean_text = " ".join(tokens)
         return clean_text, commands
     
@@ -312,7 +321,6 @@ class CommandExecutor:
         """Simple fallback text area detection"""
         try:
             # Store current clipboard content
-            import pyperclip
             original_clipboard = ""
             try:
                 original_clipboard = pyperclip.paste()
@@ -349,9 +357,6 @@ class CommandExecutor:
         """Temporarily disable Windows system sounds"""
         try:
             # Disable Windows default beep
-            import ctypes
-            import ctypes.wintypes
-            
             # Get handle to kernel32
             kernel32 = ctypes.windll.kernel32
             
@@ -365,7 +370,6 @@ class CommandExecutor:
         """Re-enable Windows system sounds"""
         try:
             # Re-enable by calling with normal frequency
-            import ctypes
             kernel32 = ctypes.windll.kernel32
             kernel32.Beep(1000, 1)  # Brief beep to re-enable
             
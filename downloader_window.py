@@ -20,7 +20,8 @@ except (ImportError, ValueError):
 class DownloaderWindow:
     """GUI for downloading Whisper models"""
     
-    def __init__(self, parent: Optional[tk.Widget] = None, on_downloads_complete: Optional[callable] = None):
+    def __init__(self, parent: Optional[tk.Widget] = None, on_downloads_complete: Optional[callable] = None,
+                 model_manager: Optional[ModelManager] = None):
         self.parent = parent
         self.on_downloads_complete = on_downloads_complete  # Callback for when downloads finish
         self.download_thread = None
@@ -41,8 +42,9 @@ class DownloaderWindow:
         else:
             self._center_on_screen()
         
-        # Model manager
-        self.model_manager = ModelManager()
+        # Model manager (the app's own when given, so its cached folder
+        # listing is the one invalidated after a download)
+        self.model_manager = model_manager or ModelManager()
         
         # Get all models (standard only, custom models can't be downloaded)
         self.model_info = {}
@@ -443,6 +445,9 @@ class DownloaderWindow:
                 self.status_var.set(f"Error downloading {model_name}: {str(e)}")
                 break
         
+        # New files landed in the models folder; drop the cached listing
+        self.model_manager.invalidate_cache()
+        
         # Finish
         if self.progress_var.get() >= 100:
             self.status_var.set("✅ All downloads completed successfully!")
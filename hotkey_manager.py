@@ -10,6 +10,27 @@ from typing import Callable, Optional, Dict, Any
 import threading
 
 
+# Modifier keys -> (config name, display name)
+_MODIFIER_NAMES = {
+    Key.ctrl_l: ('ctrl', 'Ctrl'), Key.ctrl_r: ('ctrl', 'Ctrl'),
+    Key.alt_l: ('alt', 'Alt'), Key.alt_r: ('alt', 'Alt'),
+    Key.shift_l: ('shift', 'Shift'), Key.shift_r: ('shift', 'Shift'),
+}
+_MODS = frozenset(_MODIFIER_NAMES)
+_MOD_STRS = frozenset(('ctrl', 'alt', 'shift'))
+
+# Keys that are too disruptive to use as a single-key hotkey
+_BLOCKED_SINGLE = frozenset((Key.enter, Key.tab, Key.esc, Key.backspace, Key.delete))
+
+# Capturable mouse buttons (side buttons are missing on some platforms)
+_BUTTON_MAP = {
+    getattr(Button, name): (name, display)
+    for name, display in (('right', 'Right Click'), ('middle', 'Middle Click'),
+                          ('x1', 'Side Button 1'), ('x2', 'Side Button 2'))
+    if hasattr(Button, name)
+}
+
+
 class HotkeyManager:
     """Manages global hotkey listeners for keyboard and mouse"""
     
@@ -23,8 +44,11 @@ class HotkeyManager:
         self.keyboard_listener = None
         self.mouse_listener = None
         self.is_setting_hotkey = False
-        self.is_pressed = False
+        # Single-slot press state; dict.setdefault/pop are atomic under the GIL,
+        # so keyboard and mouse hook threads can't both fire press/release
+        self._press_state = {}
         self.pressed_keys = set()  # Track currently pressed keys for combinations
+        self._cache_hotkey_target()
         
         # Start listeners
         self.start_listeners()
@@ -33,21 +57,21 @@ class HotkeyManager:
         """Start global hotkey listeners"""
         self.stop_listeners()
         
-        # Keyboard listener
-        self.keyboard_listener = KeyboardListener(
-            on_press=self._on_key_press,
-            on_release=self._on_key_release,
-            suppress=False
-        )
-        
-        # Mouse listener
-        self.mouse_listener = MouseListener(
-            on_click=self._on_mouse_click,
-            suppress=False
-        )
-        
-        self.keyboard_listener.start()
-        self.mouse_listener.start()
+        # Only hook the input device the current hotkey can come from;
+        # the other listener would just filter every event and return
+        if self.current_hotkey.get('type') == 'mouse':
+            self.mouse_listener = MouseListener(
+                on_click=self._on_mouse_click,
+                suppress=False
+            )
+            self.mouse_listener.start()
+        else:
+            self.keyboard_listener = KeyboardListener(
+                on_press=self._on_key_press,
+                on_release=self._on_key_release,
+                suppress=False
+            )
+            self.keyboard_listener.start()
     
     def stop_listeners(self):
         """Stop all listeners"""
@@ -59,6 +83,7 @@ class HotkeyManager:
                     print("Warning: Keyboard listener did not stop cleanly")
             except (RuntimeError, OSError) as e:
                 print(f"Error stopping keyboard listener: {e}")
+            self.keyboard_listener = None
         if self.mouse_listener:
             self.mouse_listener.stop()
             try:
@@ -67,27 +92,54 @@ class HotkeyManager:
                     print("Warning: Mouse listener did not stop cleanly")
             except (RuntimeError, OSError) as e:
                 print(f"Error stopping mouse listener: {e}")
+            self.mouse_listener = None
     
     def set_hotkey(self, hotkey_config: Dict[str, Any]):
         """Set new hotkey configuration"""
         self.current_hotkey = hotkey_config
-        self.is_pressed = False
-        # Restart listeners to apply new hotkey
+        self._press_state.clear()
+        self.pressed_keys.clear()
+        self._cache_hotkey_target()
+        # Restart listeners to apply new hotkey (and swap listener type)
         self.start_listeners()
     
+    @property
+    def is_pressed(self) -> bool:
+        """Whether the hotkey is currently held down"""
+        return 'pressed' in self._press_state
+    
+    def _mark_pressed(self) -> bool:
+        """Atomically set the pressed flag; True only for the caller that set it"""
+        token = object()
+        return self._press_state.setdefault('pressed', token) is token
+    
+    def _mark_released(self) -> bool:
+        """Atomically clear the pressed flag; True only for the caller that cleared it"""
+        return self._press_state.pop('pressed', None) is not None
+    
+    def _cache_hotkey_target(self):
+        """Pre-compute the lowercased main key and modifier of the current hotkey"""
+        combo = self.current_hotkey.get('combo')
+        if combo:
+            target = combo.get('key')
+            self._target_modifier = combo.get('modifier')
+        else:
+            target = self.current_hotkey.get('key', 'space')
+            self._target_modifier = None
+        self._target_key = target.lower() if isinstance(target, str) else None
+    
     def _on_key_press(self, key):
         """Handle keyboard key press"""
         if self.is_setting_hotkey:
             return True
         
-        # Track pressed keys for combinations
-        self.pressed_keys.add(key)
+        # Only modifiers are needed to match combinations
+        if key in _MODS:
+            self.pressed_keys.add(key)
         
         if self.current_hotkey['type'] == 'key' and self._matches_key(key):
-            if not self.is_pressed:
-                self.is_pressed = True
-                if self.on_hotkey_press:
-                    self.on_hotkey_press()
+            if self._mark_pressed() and self.on_hotkey_press:
+                self.on_hotkey_press()
         return True
     
     def _on_key_release(self, key):
@@ -96,13 +148,12 @@ class HotkeyManager:
             return True
         
         # Remove from pressed keys
-        self.pressed_keys.discard(key)
+        if key in _MODS:
+            self.pressed_keys.discard(key)
         
         if self.current_hotkey['type'] == 'key' and self._matches_key(key):
-            if self.is_pressed:
-                self.is_pressed = False
-                if self.on_hotkey_release:
-                    self.on_hotkey_release()
+            if self._mark_released() and self.on_hotkey_release:
+                self.on_hotkey_release()
         return True
     
     def _on_mouse_click(self, x, y, button, pressed):
@@ -111,41 +162,25 @@ class HotkeyManager:
             return True
         
         if self.current_hotkey['type'] == 'mouse' and self._matches_mouse_button(button):
-            if pressed and not self.is_pressed:
-                self.is_pressed = True
-                if self.on_hotkey_press:
+            if pressed:
+                if self._mark_pressed() and self.on_hotkey_press:
                     self.on_hotkey_press()
-            elif not pressed and self.is_pressed:
-                self.is_pressed = False
-                if self.on_hotkey_release:
-                    self.on_hotkey_release()
+            elif self._mark_released() and self.on_hotkey_release:
+                self.on_hotkey_release()
         return True
     
     def _matches_key(self, key) -> bool:
         """Check if key matches current hotkey"""
-        try:
-            # Handle combination keys
-            if 'combo' in self.current_hotkey:
-                combo = self.current_hotkey['combo']
-                modifier = combo.get('modifier')
-                main_key = combo.get('key')
-                
-                # Check if this is the main key and modifier is pressed
-                if self._key_matches(key, main_key):
-                    return self._is_modifier_pressed(modifier)
-                
-                return False
-            
-            # Handle single keys (legacy support)
-            hotkey_key = self.current_hotkey.get('key', 'space')
-            return self._key_matches(key, hotkey_key)
-            
-        except (AttributeError, TypeError) as e:
-            print(f"Key matching error: {e}")
+        if not self._key_matches(key, self._target_key):
             return False
+        
+        # Combination keys also need their modifier held
+        if self._target_modifier is not None:
+            return self._is_modifier_pressed(self._target_modifier)
+        return True
     
     def _key_matches(self, key, target_key):
-        """Check if a key matches the target key string"""
+        """Check if a key matches the (lowercase) target key string"""
         if target_key == 'space':
             return key == Key.space
         elif target_key == 'ctrl':
@@ -156,9 +191,11 @@ class HotkeyManager:
             return key == Key.shift_l or key == Key.shift_r
         elif target_key == 'enter':
             return key == Key.enter
-        elif hasattr(key, 'char') and key.char:
-            return key.char.lower() == target_key.lower()
-        return False
+        char = getattr(key, 'char', None)
+        if char is None or target_key is None:
+            return False
+        # Most key events already carry a lowercase char; skip the lower() then
+        return char == target_key or char.lower() == target_key
     
     def _is_modifier_pressed(self, modifier):
         """Check if the specified modifier key is currently pressed"""
@@ -172,24 +209,13 @@ class HotkeyManager:
     
     def _matches_mouse_button(self, button) -> bool:
         """Check if mouse button matches current hotkey"""
-        try:
-            hotkey_button = self.current_hotkey.get('button', 'left')
-            
-            if hotkey_button == 'left':
-                return button == Button.left
-            elif hotkey_button == 'right':
-                return button == Button.right
-            elif hotkey_button == 'middle':
-                return button == Button.middle
-            elif hotkey_button == 'x1':
-                return button == Button.x1
-            elif hotkey_button == 'x2':
-                return button == Button.x2
-            
-            return False
-        except (AttributeError, TypeError) as e:
-            print(f"Mouse button matching error: {e}")
+        hotkey_button = self.current_hotkey.get('button', 'left')
+        if hotkey_button not in ('left', 'right', 'middle', 'x1', 'x2'):
             return False
+        
+        # Side buttons are not defined on every platform (e.g. macOS)
+        target = getattr(Button, hotkey_button, None)
+        return target is not None and button == target
     
     def capture_new_hotkey(self, callback: Callable):
         """Capture a new hotkey from user input"""
@@ -215,28 +241,11 @@ class HotkeyManager:
             print(f"Key released: {key}")
             try:
                 # Check if this is a combination (modifier + key)
-                modifiers = [Key.ctrl_l, Key.ctrl_r, Key.alt_l, Key.alt_r, Key.shift_l, Key.shift_r]
-                pressed_modifiers = [k for k in capture_pressed_keys if k in modifiers]
+                pressed_modifiers = [k for k in capture_pressed_keys if k in _MODS]
                 
-                if pressed_modifiers and key not in modifiers:
+                if pressed_modifiers and key not in _MODS:
                     # This is a combination key
-                    modifier_key = pressed_modifiers[0]
-                    
-                    # Determine modifier name - with error handling
-                    modifier_name = 'ctrl'
-                    modifier_display = 'Ctrl'
-                    try:
-                        if modifier_key in [Key.ctrl_l, Key.ctrl_r]:
-                            modifier_name = 'ctrl'
-                            modifier_display = 'Ctrl'
-                        elif modifier_key in [Key.alt_l, Key.alt_r]:
-                            modifier_name = 'alt'
-                            modifier_display = 'Alt'
-                        elif modifier_key in [Key.shift_l, Key.shift_r]:
-                            modifier_name = 'shift'
-                            modifier_display = 'Shift'
-                    except Exception as e:
-                        print(f"Modifier key error: {e}")
+                    modifier_name, modifier_display = _MODIFIER_NAMES[pressed_modifiers[0]]
                     
                     # Determine main key - with error handling
                     main_key = 'unknown'
@@ -277,10 +286,9 @@ class HotkeyManager:
                     return False
                 
                 # Single key (no modifier)
-                elif key not in modifiers:
+                elif key not in _MODS:
                     # Block problematic single keys
-                    blocked_keys = [Key.enter, Key.tab, Key.esc, Key.backspace, Key.delete]
-                    if key in blocked_keys:
+                    if key in _BLOCKED_SINGLE:
                         print(f"Single {key.name} blocked - use in combination only")
                         capture_pressed_keys.discard(key)
                         return True
@@ -317,23 +325,11 @@ class HotkeyManager:
                     # Handle left-click as "Enter" for combinations
                     if button == Button.left:
                         # Check if any modifier is pressed
-                        modifiers = [Key.ctrl_l, Key.ctrl_r, Key.alt_l, Key.alt_r, Key.shift_l, Key.shift_r]
-                        pressed_modifiers = [k for k in self.pressed_keys if k in modifiers]
+                        pressed_modifiers = [k for k in self.pressed_keys if k in _MODS]
                         
                         if pressed_modifiers:
                             # This is a combination with left-click as "Enter"
-                            modifier_key = pressed_modifiers[0]
-                            
-                            # Determine modifier name
-                            if modifier_key in [Key.ctrl_l, Key.ctrl_r]:
-                                modifier_name = 'ctrl'
-                                modifier_display = 'Ctrl'
-                            elif modifier_key in [Key.alt_l, Key.alt_r]:
-                                modifier_name = 'alt'
-                                modifier_display = 'Alt'
-                            elif modifier_key in [Key.shift_l, Key.shift_r]:
-                                modifier_name = 'shift'
-                                modifier_display = 'Shift'
+                            modifier_name, modifier_display = _MODIFIER_NAMES[pressed_modifiers[0]]
                             
                             hotkey_config = {
                                 'type': 'key',
@@ -351,15 +347,8 @@ class HotkeyManager:
                             print(f"Left-click alone not allowed - use with Ctrl/Alt/Shift for combinations")
                             return True
                     
-                    button_mappings = {
-                        Button.right: ('right', 'Right Click'),
-                        Button.middle: ('middle', 'Middle Click'),
-                        Button.x1: ('x1', 'Side Button 1'),
-                        Button.x2: ('x2', 'Side Button 2')
-                    }
-                    
-                    if button in button_mappings:
-                        button_key, display_name = button_mappings[button]
+                    if button in _BUTTON_MAP:
+                        button_key, display_name = _BUTTON_MAP[button]
                         hotkey_config = {'type': 'mouse', 'button': button_key}
                         
                         self.is_setting_hotkey = False
@@ -373,9 +362,10 @@ class HotkeyManager:
         try:
             capture_keyboard = KeyboardListener(
                 on_press=on_key_capture_press,
-                on_release=on_key_capture_release
+                on_release=on_key_capture_release,
+                suppress=False
             )
-            capture_mouse = MouseListener(on_click=on_mouse_capture)
+            capture_mouse = MouseListener(on_click=on_mouse_capture, suppress=False)
             
             print("Starting capture listeners...")
             capture_keyboard.start()
@@ -433,8 +423,8 @@ class HotkeyManager:
                     if pressed_keys:
                         print(f"Enter confirming combination: {list(pressed_keys)}")
                         # Build hotkey from current keys
-                        modifiers = [k for k in pressed_keys if k in ['ctrl', 'alt', 'shift']]
-                        main_keys = [k for k in pressed_keys if k not in ['ctrl', 'alt', 'shift']]
+                        modifiers = [k for k in pressed_keys if k in _MOD_STRS]
+                        main_keys = [k for k in pressed_keys if k not in _MOD_STRS]
                         
                         if modifiers and main_keys:
                             # Combination hotkey
@@ -511,8 +501,8 @@ class HotkeyManager:
                 if pressed_keys:
                     print(f"Left-click confirming combination: {list(pressed_keys)}")
                     # Build hotkey from current keys
-                    modifiers = [k for k in pressed_keys if k in ['ctrl', 'alt', 'shift']]
-                    main_keys = [k for k in pressed_keys if k not in ['ctrl', 'alt', 'shift']]
+                    modifiers = [k for k in pressed_keys if k in _MOD_STRS]
+                    main_keys = [k for k in pressed_keys if k not in _MOD_STRS]
                     
                     if modifiers and main_keys:
                         # Combination hotkey
@@ -538,9 +528,10 @@ class HotkeyManager:
         try:
             feedback_keyboard = KeyboardListener(
                 on_press=on_key_press_feedback,
-                on_release=on_key_release_feedback
+                on_release=on_key_release_feedback,
+                suppress=False
             )
-            feedback_mouse = MouseListener(on_click=on_mouse_click_feedback)
+            feedback_mouse = MouseListener(on_click=on_mouse_click_feedback, suppress=False)
             
             feedback_keyboard.start()
             feedback_mouse.start()
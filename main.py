@@ -10,18 +10,56 @@ from hotkey_manager import HotkeyManager
 from command_structure import CommandParser, CommandExecutor
 import sys
 import pyperclip
-import threading
-import time
 import signal
 import atexit
+import time
+import logging
+import threading
+from dataclasses import dataclass
+
+# Hot-path diagnostics go through logging so disabled levels skip formatting
+log = logging.getLogger('v3ptt')
+log.setLevel(logging.WARNING)
+
+# Audio level polling intervals (ms)
+_MONITOR_INTERVAL = 200
+_MONITOR_ERROR_DELAY = 500
+_MONITOR_MAX_BACKOFF = 5000
+
+
+@dataclass(frozen=True)
+class _Cfg:
+    """Snapshot of the settings read on hot paths, rebuilt by apply_settings"""
+    copy_clipboard: bool
+    clear_clipboard_on_close: bool
+    always_on_top: bool
+    type_delay: float
+    technical_filter: bool
+    voice_commands: bool
+    hotkey_display: str
 
 
 class V3PTTApp:
     """Main application class that coordinates all components"""
     
     def __init__(self):
+        # Pending root.after id that resets the status bar to "Ready"
+        self._ready_after_id = None
+        
         # Initialize components
         self.settings = SettingsManager()
+        # Start from the defaults so hot paths always have a snapshot, even
+        # if apply_settings fails to read one
+        defaults = self.settings.default_settings
+        self._cfg = _Cfg(
+            copy_clipboard=defaults['copy_clipboard'],
+            clear_clipboard_on_close=defaults['clear_clipboard_on_close'],
+            always_on_top=defaults['always_on_top'],
+            type_delay=defaults['type_delay'],
+            technical_filter=defaults['technical_filter'],
+            voice_commands=defaults['voice_commands'],
+            hotkey_display="",
+        )
         self.command_parser = CommandParser()
         self.command_executor = CommandExecutor(self.settings.get_type_delay())
         
@@ -50,11 +88,16 @@ class V3PTTApp:
         # Apply settings
         self.apply_settings()
         
-        # Update model status in UI
-        self.update_model_status()
+        # Update model status once the window has painted (it scans the models folder)
+        self.ui.root.after(50, self.update_model_status)
+        
+        # Import the settings window in the background of the event loop so
+        # the first click doesn't pay for it
+        self._SettingsWindow = None
+        self.ui.root.after(1500, self._prewarm_settings)
         
         # Start audio level monitoring
-        self.monitoring_active = True
+        self._monitor_stop = threading.Event()
         self.start_audio_monitoring()
         
         # Register cleanup handlers
@@ -65,18 +108,27 @@ class V3PTTApp:
     def apply_settings(self):
         """Apply loaded settings to all components"""
         try:
+            cfg = self._cfg = _Cfg(
+                copy_clipboard=self.settings.get_copy_clipboard(),
+                clear_clipboard_on_close=self.settings.get_clear_clipboard_on_close(),
+                always_on_top=self.settings.get_always_on_top(),
+                type_delay=self.settings.get_type_delay(),
+                technical_filter=self.settings.get_technical_filter(),
+                voice_commands=self.settings.get_voice_commands(),
+                hotkey_display=self.settings.get_hotkey_display_text(),
+            )
+            
             self.audio_handler.set_device(self.settings.get_device_index())
             self.hotkey_manager.set_hotkey(self.settings.get_hotkey())
-            self.ui.update_hotkey_display(self.settings.get_hotkey_display_text())
+            self.ui.update_hotkey_display(cfg.hotkey_display)
             
             # Only update always_on_top if it actually changed
             # This prevents window jumping when settings are applied
-            new_always_on_top = self.settings.get_always_on_top()
             current_always_on_top = self.ui.root.attributes('-topmost')
-            if new_always_on_top != current_always_on_top:
-                self.ui.set_always_on_top(new_always_on_top)
+            if cfg.always_on_top != current_always_on_top:
+                self.ui.set_always_on_top(cfg.always_on_top)
             
-            self.command_executor.set_type_delay(self.settings.get_type_delay())
+            self.command_executor.set_type_delay(cfg.type_delay)
             
             # Apply mic mute state and update UI
             mic_muted = self.settings.get_mic_muted()
@@ -84,47 +136,50 @@ class V3PTTApp:
             self.ui.set_mic_mute_state(mic_muted)
             
             # Apply technical filter setting
-            technical_filter_enabled = self.settings.get_technical_filter()
-            if technical_filter_enabled:
+            if cfg.technical_filter:
                 self.command_parser.enable_text_normalization()
             else:
                 self.command_parser.disable_text_normalization()
 
             # Apply voice commands setting
-            voice_commands_enabled = self.settings.get_voice_commands()
-            if voice_commands_enabled:
+            if cfg.voice_commands:
                 self.command_parser.enable_commands()
             else:
                 self.command_parser.disable_commands()
 
-            print(f"Settings applied - Hotkey: {self.settings.get_hotkey_display_text()}, "
-                  f"Technical Filter: {'On' if technical_filter_enabled else 'Off'}, "
-                  f"Voice Commands: {'On' if voice_commands_enabled else 'Off'}")
+            print(f"Settings applied - Hotkey: {cfg.hotkey_display}, "
+                  f"Technical Filter: {'On' if cfg.technical_filter else 'Off'}, "
+                  f"Voice Commands: {'On' if cfg.voice_commands else 'Off'}")
         except Exception as e:
             print(f"Error applying settings: {e}")
             self.ui.update_status(f"Settings error: {str(e)}")
     
     def start_audio_monitoring(self):
         """Start monitoring audio levels in a separate thread"""
-        def monitor_audio():
-            while self.monitoring_active:
-                try:
-                    # Only monitor if not recording to avoid device conflicts
-                    if not self.audio_handler.is_recording:
-                        level = self.audio_handler.get_audio_level()
-                        # Update UI in main thread - fix lambda closure issue
-                        self.ui.root.after(0, lambda l=level: self.ui.update_audio_level(l))
-                    time.sleep(0.2)  # Update every 200ms (less frequent to reduce load)
-                except Exception as e:
-                    # Log errors but don't spam console
-                    print(f"Audio monitoring error: {e}")
-                    time.sleep(0.5)  # Wait longer on error
-        
-        # Start monitoring in background thread
-        self.monitoring_thread = threading.Thread(target=monitor_audio, daemon=True)
+        # Reading (or reopening) the input device blocks, so it stays off
+        # the Tk thread; levels are posted to the UI with after()
+        self.monitoring_thread = threading.Thread(target=self._monitor_audio, daemon=True)
         self.monitoring_thread.start()
         print("Audio monitoring thread started")
     
+    def _monitor_audio(self):
+        """Sample the input level every interval until stopped"""
+        delay = _MONITOR_INTERVAL
+        backoff = _MONITOR_ERROR_DELAY
+        while not self._monitor_stop.wait(delay / 1000.0):
+            delay = _MONITOR_INTERVAL
+            try:
+                # Only monitor if not recording to avoid device conflicts
+                if not self.audio_handler.is_recording:
+                    level = self.audio_handler.get_audio_level()
+                    self.ui.root.after(0, self.ui.update_audio_level, level)
+                backoff = _MONITOR_ERROR_DELAY
+            except Exception as e:
+                # Back off exponentially while the device keeps failing
+                log.warning("Audio monitoring error: %s", e)
+                delay = backoff
+                backoff = min(backoff * 2, _MONITOR_MAX_BACKOFF)
+    
     def start_recording(self):
         """Start audio recording"""
         self.audio_handler.start_recording()
@@ -143,11 +198,9 @@ class V3PTTApp:
         self.ui.update_status(status)
     
     def on_transcript_ready(self, text: str):
-        """Handle completed transcription"""
-        self.ui.update_transcript(text)
-        
+        """Handle completed transcription (runs on the transcription thread)"""
         if not text.strip():
-            self.ui.update_status("No speech detected")
+            self._post_result({'transcript': text, 'status': "No speech detected"})
             return
         
         # Parse for commands and normalize text FIRST
@@ -155,16 +208,17 @@ class V3PTTApp:
         
         # Copy normalized text to clipboard if enabled
         clipboard_success = False
-        if self.settings.get_copy_clipboard():
+        if self._cfg.copy_clipboard:
             clipboard_text = clean_text.strip()
-            print(f"Copying to clipboard: '{clipboard_text}'")
+            log.debug("Copying to clipboard: %r", clipboard_text)
             try:
+                # pyperclip raises if no clipboard backend worked, so a clean
+                # return is success; no paste() round-trip to verify it
                 pyperclip.copy(clipboard_text)
-                clipboard_success = pyperclip.paste() == clipboard_text
-                print("✅ Clipboard copy successful" if clipboard_success
-                      else "❌ Clipboard verification failed")
+                clipboard_success = True
+                log.debug("Clipboard copy successful")
             except Exception as e:
-                print(f"❌ Clipboard error: {e}")
+                log.warning("Clipboard error: %s", e)
                 clipboard_success = False
         
         # Execute text and commands - this returns a status message, not text to type
@@ -177,18 +231,57 @@ class V3PTTApp:
         if result:
             status_parts.append(result)
         
+        # Transcript and status go to the UI together; a combined status is
+        # cleared after 3 seconds to return to "Ready"
         if status_parts:
-            combined_status = " • ".join(status_parts)
-            self.ui.update_status(combined_status)
-            # Clear status after 3 seconds to return to "Ready"
-            self.ui.root.after(3000, lambda: self.ui.update_status("Ready"))
+            self._post_result({'transcript': text, 'status': " • ".join(status_parts)},
+                              reset_ready=True)
         else:
-            self.ui.update_status("Ready")
+            self._post_result({'transcript': text, 'status': "Ready"})
+    
+    def _post_result(self, update: dict, reset_ready: bool = False):
+        """Hand a transcript result to the Tk thread (thread-safe)"""
+        try:
+            self.ui.root.after(0, self._show_result, update, reset_ready)
+        except Exception:
+            pass  # UI torn down
+    
+    def _show_result(self, update: dict, reset_ready: bool):
+        """Apply a transcript result and (re)arm the "Ready" reset (Tk thread)"""
+        # A new result supersedes any pending "Ready" reset from the last one
+        self._cancel_ready_reset()
+        self.ui.apply_update(update)
+        if reset_ready:
+            self._ready_after_id = self.ui.root.after(3000, self._reset_ready_status)
+    
+    def _reset_ready_status(self):
+        """Return the status bar to "Ready" after a transcript result"""
+        self._ready_after_id = None
+        self.ui.update_status("Ready")
+    
+    def _cancel_ready_reset(self):
+        """Cancel a scheduled "Ready" reset, if any"""
+        after_id, self._ready_after_id = self._ready_after_id, None
+        if after_id is not None:
+            try:
+                self.ui.root.after_cancel(after_id)
+            except Exception:
+                pass  # Already fired or UI torn down
+    
+    def _prewarm_settings(self):
+        """Import the settings window module ahead of first use"""
+        try:
+            import settings_window
+            self._SettingsWindow = settings_window.SettingsWindow
+        except Exception as e:
+            print(f"Settings prewarm failed: {e}")
     
     def open_settings(self):
         """Open settings window"""
         try:
-            from settings_window import SettingsWindow
+            SettingsWindow = self._SettingsWindow
+            if SettingsWindow is None:
+                from settings_window import SettingsWindow
             # Drop main topmost so settings can sit above it reliably
             self.ui.root.attributes('-topmost', False)
             settings_window = SettingsWindow(
@@ -200,7 +293,7 @@ class V3PTTApp:
             )
             # Restore main topmost when settings closes
             def _restore_topmost():
-                if self.settings.get_always_on_top():
+                if self._cfg.always_on_top:
                     self.ui.root.attributes('-topmost', True)
             settings_window.window.bind('<Destroy>',
                 lambda e, w=settings_window.window: _restore_topmost() if e.widget is w else None)
@@ -252,26 +345,33 @@ class V3PTTApp:
         print("Starting cleanup...")
         self._cleanup_done = True
         
-        # Stop monitoring thread first
-        self.monitoring_active = False
+        # Stop monitoring thread first (wakes it from its interval wait)
+        if hasattr(self, '_monitor_stop'):
+            self._monitor_stop.set()
         
         # Collect all threads that need to be joined
         threads_to_join = []
         
-        # Add monitoring thread
         if hasattr(self, 'monitoring_thread') and self.monitoring_thread.is_alive():
             threads_to_join.append(('monitoring', self.monitoring_thread))
         
-        # Add audio handler recording thread
-        if hasattr(self, 'audio_handler') and hasattr(self.audio_handler, 'recording_thread'):
-            if self.audio_handler.recording_thread and self.audio_handler.recording_thread.is_alive():
-                threads_to_join.append(('recording', self.audio_handler.recording_thread))
+        if hasattr(self, 'audio_handler'):
+            # Signal the recorder to stop before joining so it winds down
+            # while we wait, rather than after the join times out
+            if self.audio_handler.is_recording:
+                self.audio_handler.stop_recording()
+            for thread_name, attr in (('recording', 'recording_thread'),
+                                      ('model loading', 'model_loading_thread')):
+                thread = getattr(self.audio_handler, attr, None)
+                if thread and thread.is_alive():
+                    threads_to_join.append((thread_name, thread))
         
-        # Wait for all threads to complete
+        # Wait for all threads against one shared deadline (max, not sum, of timeouts)
+        deadline = time.monotonic() + 2.0
         for thread_name, thread in threads_to_join:
             try:
                 print(f"Waiting for {thread_name} thread to finish...")
-                thread.join(timeout=2.0)
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
                 if thread.is_alive():
                     print(f"Warning: {thread_name} thread did not finish cleanly")
                 else:
@@ -295,14 +395,20 @@ class V3PTTApp:
             except Exception as e:
                 print(f"Error cleaning up hotkey manager: {e}")
         
-        # Clear clipboard if enabled
+        # Write any settings changes still waiting on the debounce timer
         if hasattr(self, 'settings'):
             try:
-                if self.settings.get_clear_clipboard_on_close():
-                    pyperclip.copy("")  # Clear clipboard
-                    print("Clipboard cleared")
+                self.settings.flush()
             except Exception as e:
-                print(f"Error clearing clipboard: {e}")
+                print(f"Error flushing settings: {e}")
+        
+        # Clear clipboard if enabled
+        try:
+            if self._cfg.clear_clipboard_on_close:
+                pyperclip.copy("")  # Clear clipboard
+                print("Clipboard cleared")
+        except Exception as e:
+            print(f"Error clearing clipboard: {e}")
         
         # Clean up UI
         if hasattr(self, 'ui'):
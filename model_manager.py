@@ -5,100 +5,190 @@
 
 import os
 import asyncio
+import functools
 import threading
 import time
 import requests
-from typing import Dict, List, Optional, Callable
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Callable, Tuple
 import whisper
 
+# Base size estimates (approximate)
+_SIZE_ESTIMATES = {
+    'tiny': '72MB', 'base': '290MB', 'small': '967MB', 
+    'medium': '3.1GB', 'large': '6.2GB', 'turbo': '1.5GB'
+}
+
+_DESCRIPTIONS = {
+    'tiny': 'Fastest, least accurate',
+    'base': 'Good balance (recommended)',
+    'small': 'Better accuracy',
+    'medium': 'High accuracy',
+    'large': 'Best accuracy, slowest'
+}
+
+# Fallback to known models if discovery fails
+_FALLBACK_MODELS = ['tiny', 'base', 'small', 'medium', 'large']
+
+# Download speeds in MB/s used for time estimates
+_SPEEDS_MB_S = {
+    'slow': 1,      # 1 MB/s (mobile/poor)
+    'medium': 10,   # 10 MB/s (normal broadband)
+    'fast': 50      # 50 MB/s (good broadband)
+}
+
+# Approximate download size per standard model, in MB
+_SIZE_MB = {
+    'tiny': 72, 'base': 290, 'small': 967, 
+    'medium': 3100, 'large': 6200
+}
+
+# Connectivity probe; answers 204 No Content when the network is up
+_CONNECTIVITY_URL = 'http://connectivitycheck.gstatic.com/generate_204'
+
+# Shared keep-alive session so repeated checks reuse the connection pool
+_SESSION = requests.Session()
+
+# How long a models-folder listing is reused before rescanning (seconds)
+_SNAPSHOT_TTL = 5.0
+
+
+def _human_size(n: int) -> str:
+    """Format a byte count as KB/MB/GB (unit picked from the bit length)"""
+    bits = n.bit_length()
+    if bits <= 20:  # Less than 1MB
+        return f"{n >> 10}KB"
+    if bits <= 30:  # Less than 1GB
+        return f"{n >> 20}MB"
+    return f"{n / (1 << 30):.1f}GB"
+
+
+@functools.lru_cache(maxsize=None)
+def _build_model_info(models: Tuple[str, ...]) -> Dict:
+    """Build size/description info for a set of Whisper model names"""
+    model_info = {}
+    for model in models:
+        # Extract base model name for size estimation
+        base_name = model.split('.')[0].split('-')[0]  # tiny.en -> tiny, large-v3 -> large
+        
+        # Get size estimate
+        size = _SIZE_ESTIMATES.get(base_name, '~GB')
+        
+        # Generate description
+        if '.en' in model:
+            desc = f"English-only {base_name} model"
+        elif 'turbo' in model:
+            desc = "Fast, optimized model"
+        elif 'large-v' in model:
+            version = model.split('-v')[1] if '-v' in model else ''
+            desc = f"Large model version {version}"
+        else:
+            desc = _DESCRIPTIONS.get(base_name, 'Whisper model')
+        
+        model_info[model] = {'size': size, 'desc': desc}
+    
+    return model_info
+
+
+@functools.lru_cache(maxsize=64)
+def _estimate_download_time(model_size: str, connection_speed: str) -> str:
+    """Estimate download time for a model at a given connection speed"""
+    if model_size not in _SIZE_MB:
+        return "Unknown"
+        
+    mb = _SIZE_MB[model_size]
+    speed = _SPEEDS_MB_S.get(connection_speed, 10)
+    seconds = mb / speed
+    
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    elif seconds < 3600:
+        return f"{int(seconds/60)}m"
+    else:
+        return f"{int(seconds/3600)}h {int((seconds%3600)/60)}m"
+
+
 class ModelManager:
     """Async manager for Whisper model availability and updates"""
     
+    # whisper.available_models() result, shared by all instances
+    _discovered_models: Optional[List[str]] = None
+    
     def __init__(self, status_callback: Optional[Callable] = None):
         self.status_callback = status_callback
         self.local_models_dir = os.path.join(os.path.dirname(__file__), 'models')
         self.cache_dir = os.path.expanduser("~/.cache/whisper")
         
         # Dynamically get available models from Whisper
-        try:
-            self.available_models = sorted(whisper.available_models())
-        except Exception:
-            # Fallback to known models if discovery fails
-            self.available_models = ['tiny', 'base', 'small', 'medium', 'large']
+        self.available_models = self._discover_models()
         
         # Dynamic model info with better estimates
         self.model_info = self._get_dynamic_model_info()
         self.last_check = 0
         self.check_interval = 3600  # Check every hour
+        
+        # Cached {filename: DirEntry} listing of the models folder
+        self._local_entries = None
+        self._snapshot_ts = 0.0
+        # get_quick_status result, keyed by the models folder mtime
+        self._quick_status_key = None
+        self._quick_status = None
+    
+    @classmethod
+    def _discover_models(cls) -> List[str]:
+        """Get the sorted Whisper model list, querying whisper only once"""
+        if cls._discovered_models is None:
+            try:
+                cls._discovered_models = sorted(whisper.available_models())
+            except Exception:
+                return list(_FALLBACK_MODELS)
+        return list(cls._discovered_models)
     
     def _get_dynamic_model_info(self) -> Dict:
         """Get model info dynamically for any available model"""
-        # Base size estimates (approximate)
-        size_estimates = {
-            'tiny': '72MB', 'base': '290MB', 'small': '967MB', 
-            'medium': '3.1GB', 'large': '6.2GB', 'turbo': '1.5GB'
-        }
-        
-        # Generate info for all available models
-        model_info = {}
-        for model in self.available_models:
-            # Extract base model name for size estimation
-            base_name = model.split('.')[0].split('-')[0]  # tiny.en -> tiny, large-v3 -> large
-            
-            # Get size estimate
-            size = size_estimates.get(base_name, '~GB')
-            
-            # Generate description
-            if '.en' in model:
-                desc = f"English-only {base_name} model"
-            elif 'turbo' in model:
-                desc = "Fast, optimized model"
-            elif 'large-v' in model:
-                version = model.split('-v')[1] if '-v' in model else ''
-                desc = f"Large model version {version}"
-            else:
-                descriptions = {
-                    'tiny': 'Fastest, least accurate',
-                    'base': 'Good balance (recommended)',
-                    'small': 'Better accuracy',
-                    'medium': 'High accuracy',
-                    'large': 'Best accuracy, slowest'
-                }
-                desc = descriptions.get(base_name, 'Whisper model')
-            
-            model_info[model] = {'size': size, 'desc': desc}
-        
-        return model_info
+        # Copy: scans add custom models to the per-instance dict
+        return dict(_build_model_info(tuple(self.available_models)))
+    
+    def _snapshot_dirs(self) -> Dict[str, os.DirEntry]:
+        """Return the .pt files in the models folder, rescanning at most every few seconds"""
+        now = time.monotonic()
+        if self._local_entries is None or now - self._snapshot_ts > _SNAPSHOT_TTL:
+            try:
+                with os.scandir(self.local_models_dir) as it:
+                    self._local_entries = {e.name: e for e in it
+                                           if e.name.endswith('.pt') and e.is_file()}
+            except OSError:
+                self._local_entries = {}
+            self._snapshot_ts = now
+        return self._local_entries
+    
+    def invalidate_cache(self):
+        """Force the next lookup to rescan the models folder (e.g. after a download)"""
+        self._local_entries = None
+        self._quick_status_key = None
+    
+    def _entry_size_str(self, entry: os.DirEntry) -> str:
+        """Human readable size of a models-folder entry"""
+        try:
+            return _human_size(entry.stat().st_size)
+        except OSError:
+            return "Unknown"
     
     def _scan_custom_models(self) -> List[str]:
         """Scan models folder for custom .pt files"""
         custom_models = []
         
-        if os.path.exists(self.local_models_dir):
-            for filename in os.listdir(self.local_models_dir):
-                if filename.endswith('.pt'):
-                    model_name = filename[:-3]  # Remove .pt extension
-                    # Only add if not already in standard models
-                    if model_name not in self.available_models:
-                        custom_models.append(model_name)
-                        
-                        # Add to model_info for custom models
-                        file_path = os.path.join(self.local_models_dir, filename)
-                        try:
-                            file_size = os.path.getsize(file_path)
-                            if file_size < 1024*1024:  # Less than 1MB
-                                size_str = f"{file_size//1024}KB"
-                            elif file_size < 1024*1024*1024:  # Less than 1GB
-                                size_str = f"{file_size//(1024*1024)}MB"
-                            else:
-                                size_str = f"{file_size//(1024*1024*1024):.1f}GB"
-                        except:
-                            size_str = "Unknown"
-                        
-                        self.model_info[model_name] = {
-                            'size': size_str,
-                            'desc': 'Custom model'
-                        }
+        for filename, entry in self._snapshot_dirs().items():
+            model_name = filename[:-3]  # Remove .pt extension
+            # Only add if not already in standard models
+            if model_name not in self.available_models:
+                custom_models.append(model_name)
+                
+                # Add to model_info for custom models
+                self.model_info[model_name] = {
+                    'size': self._entry_size_str(entry),
+                    'desc': 'Custom model'
+                }
         
         return custom_models
     
@@ -106,36 +196,22 @@ class ModelManager:
         """Scan models folder for ALL .pt files (including standard models)"""
         local_models = []
         
-        if os.path.exists(self.local_models_dir):
-            for filename in os.listdir(self.local_models_dir):
-                if filename.endswith('.pt'):
-                    model_name = filename[:-3]  # Remove .pt extension
-                    local_models.append(model_name)
-                    
-                    # Add to model_info if not already present
-                    if model_name not in self.model_info:
-                        file_path = os.path.join(self.local_models_dir, filename)
-                        try:
-                            file_size = os.path.getsize(file_path)
-                            if file_size < 1024*1024:  # Less than 1MB
-                                size_str = f"{file_size//1024}KB"
-                            elif file_size < 1024*1024*1024:  # Less than 1GB
-                                size_str = f"{file_size//(1024*1024)}MB"
-                            else:
-                                size_str = f"{file_size//(1024*1024*1024):.1f}GB"
-                        except:
-                            size_str = "Unknown"
-                        
-                        # Determine if it's a standard model or custom
-                        if model_name in self.available_models:
-                            desc = self.model_info.get(model_name, {}).get('desc', 'Whisper model')
-                        else:
-                            desc = 'Custom model'
-                        
-                        self.model_info[model_name] = {
-                            'size': size_str,
-                            'desc': desc
-                        }
+        for filename, entry in self._snapshot_dirs().items():
+            model_name = filename[:-3]  # Remove .pt extension
+            local_models.append(model_name)
+            
+            # Add to model_info if not already present
+            if model_name not in self.model_info:
+                # Determine if it's a standard model or custom
+                if model_name in self.available_models:
+                    desc = 'Whisper model'
+                else:
+                    desc = 'Custom model'
+                
+                self.model_info[model_name] = {
+                    'size': self._entry_size_str(entry),
+                    'desc': desc
+                }
         
         return local_models
     
@@ -150,61 +226,69 @@ class ModelManager:
         if self.status_callback:
             self.status_callback(message)
     
+    def _status_snapshot(self) -> SimpleNamespace:
+        """Walk the models folder once and derive local/missing/custom/locations together"""
+        local_models = []
+        custom_models = []
+        model_locations = {}
+        
+        for filename, entry in self._snapshot_dirs().items():
+            model_name = filename[:-3]  # Remove .pt extension
+            local_models.append(model_name)
+            
+            if model_name in self.available_models:
+                model_locations[model_name] = 'bundled'
+                if model_name not in self.model_info:
+                    self.model_info[model_name] = {
+                        'size': self._entry_size_str(entry),
+                        'desc': 'Whisper model'
+                    }
+            else:
+                custom_models.append(model_name)
+                model_locations[model_name] = 'custom'
+                self.model_info[model_name] = {
+                    'size': self._entry_size_str(entry),
+                    'desc': 'Custom model'
+                }
+        
+        local_set = set(local_models)
+        missing_models = [m for m in self.available_models if m not in local_set]
+        
+        return SimpleNamespace(local=local_models, missing=missing_models,
+                               custom=custom_models, locations=model_locations)
+    
     def get_local_models(self) -> List[str]:
         """Get list of locally available models - only from models folder"""
-        # Only scan the local models directory
-        return self._scan_local_models()
+        return self._status_snapshot().local
     
     def get_missing_models(self) -> List[str]:
         """Get list of missing models (only standard models, not custom)"""
-        local = self.get_local_models()
-        return [m for m in self.available_models if m not in local]
+        return self._status_snapshot().missing
     
     def is_model_available(self, model_size: str) -> bool:
         """Check if specific model is available locally - only in models folder"""
-        local_path = os.path.join(self.local_models_dir, f"{model_size}.pt")
-        return os.path.exists(local_path)
-        cache_path_v3 = os.path.join(self.cache_dir, f"{model_size}-v3.pt")
-        
-        return (os.path.exists(local_path) or 
-                os.path.exists(cache_path) or 
-                os.path.exists(cache_path_v3))
+        return self.get_model_path(model_size) is not None
     
     def get_model_path(self, model_size: str) -> Optional[str]:
-        """Get full path to model file - only from local models folder"""
-        local_path = os.path.join(self.local_models_dir, f"{model_size}.pt")
+        """Get full path to model file - only from local models folder
         
-        if os.path.exists(local_path):
-            return local_path
-        return None
+        Single source of truth for model lookups; reads the directory snapshot.
+        """
+        entry = self._snapshot_dirs().get(f"{model_size}.pt")
+        return entry.path if entry is not None else None
     
     def get_model_status(self) -> Dict:
         """Get comprehensive model status"""
-        local_models = self.get_local_models()
-        missing_models = self.get_missing_models()
-        custom_models = self._scan_custom_models()
-        
-        # Get location info for available models
-        model_locations = {}
-        for model in local_models:
-            path = self.get_model_path(model)
-            if path:
-                if self.local_models_dir in path:
-                    if model in custom_models:
-                        model_locations[model] = 'custom'
-                    else:
-                        model_locations[model] = 'bundled'
-                else:
-                    model_locations[model] = 'cached'
+        snap = self._status_snapshot()
         
         return {
-            'local_models': local_models,
-            'missing_models': missing_models,
-            'custom_models': custom_models,
-            'total_available': len(local_models),
-            'total_missing': len(missing_models),
-            'total_custom': len(custom_models),
-            'model_locations': model_locations,
+            'local_models': snap.local,
+            'missing_models': snap.missing,
+            'custom_models': snap.custom,
+            'total_available': len(snap.local),
+            'total_missing': len(snap.missing),
+            'total_custom': len(snap.custom),
+            'model_locations': snap.locations,
             'bundled_dir': self.local_models_dir,
             'cache_dir': self.cache_dir
         }
@@ -212,37 +296,16 @@ class ModelManager:
     def check_internet_connection(self, timeout: int = 5) -> bool:
         """Check if internet connection is available"""
         try:
-            response = requests.get('https://httpbin.org/get', timeout=timeout)
-            return response.status_code == 200
-        except:
+            # Bodyless 204 endpoint: no payload, no third-party echo service
+            response = _SESSION.head(_CONNECTIVITY_URL, timeout=timeout,
+                                     allow_redirects=False)
+            return response.status_code == 204
+        except requests.RequestException:
             return False
     
     def estimate_download_time(self, model_size: str, connection_speed: str = 'medium') -> str:
         """Estimate download time based on model size and connection"""
-        speeds = {
-            'slow': 1,      # 1 MB/s (mobile/poor)
-            'medium': 10,   # 10 MB/s (normal broadband)
-            'fast': 50      # 50 MB/s (good broadband)
-        }
-        
-        size_mb = {
-            'tiny': 72, 'base': 290, 'small': 967, 
-            'medium': 3100, 'large': 6200
-        }
-        
-        if model_size not in size_mb:
-            return "Unknown"
-            
-        mb = size_mb[model_size]
-        speed = speeds.get(connection_speed, 10)
-        seconds = mb / speed
-        
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        elif seconds < 3600:
-            return f"{int(seconds/60)}m"
-        else:
-            return f"{int(seconds/3600)}h {int((seconds%3600)/60)}m"
+        return _estimate_download_time(model_size, connection_speed)
     
     async def check_model_updates_async(self) -> Dict:
         """HIPAA-compliant async model check (user-initiated only)"""
@@ -326,19 +389,31 @@ class ModelManager:
     
     def get_quick_status(self) -> str:
         """Get quick status for UI display - only count models in ./models/ folder"""
-        # Only scan local models folder (no cache)
-        local_models = self._scan_local_models()
-        custom_count = len(self._scan_custom_models())
+        # Adding or removing a file bumps the folder mtime; reuse the last
+        # result while it is unchanged
+        try:
+            key = os.stat(self.local_models_dir).st_mtime_ns
+        except OSError:
+            key = 0
+        if key == self._quick_status_key:
+            return self._quick_status
+        
+        # The folder changed: don't count from the short-lived listing
+        # snapshot, or a stale count would stick under the new mtime
+        self.invalidate_cache()
         
         # Total is only what's in the models folder
-        total_available = len(local_models)
+        total_available = len(self._scan_local_models())
         
         if total_available == 0:
-            return "❌ No models available"
+            status = "❌ No models available"
         else:
             # Simple count - no breakdown of cached
             model_text = f"{total_available} model{'s' if total_available != 1 else ''} ready"
-            return f"✅ {model_text}" 
+            status = f"✅ {model_text}"
+        
+        self._quick_status_key, self._quick_status = key, status
+        return status
     
     def cleanup(self):
         """Clean up model resources"""
@@ -364,7 +439,3 @@ class ModelManager:
                 print("Model cleanup complete")
         except Exception as e:
             print(f"Error during model cleanup: {e}")
-    
-    def __del__(self):
-        """Destructor to ensure cleanup"""
-        self.cleanup() 
\ No newline at end of file
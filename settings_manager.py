@@ -1,106 +1,297 @@
 # PTT/LoudMouth/settings_manager.py
 # JSON settings persistence manager - refactored to reduce duplication
 # Purpose: Save/load application settings with dynamic getter/setter
-# Dependencies: json, os, typing
+# Dependencies: json (orjson used when installed), os, threading, atexit, logging, typing
 
 import json
 import os
+import threading
+import atexit
+import logging
+from collections import ChainMap
+from types import MappingProxyType
 from typing import Dict, Any, Optional
+try:
+    import orjson  # Optional fast JSON codec
+except ImportError:
+    orjson = None
+
+# Diagnostics are debug-level by default so saves don't write to the console
+log = logging.getLogger('v3ptt.settings')
+
+# Directory holding this module, resolved once per process
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Marks a key with no value (distinct from a stored None)
+_MISSING = object()
+
+# Setter writes within this window are coalesced into one save (seconds)
+_FLUSH_DELAY = 0.25
+
+# Default settings with type hints for validation
+_DEFAULT_SETTINGS = MappingProxyType({
+    "hotkey": {"type": "key", "key": "shift"},
+    "selected_device_index": -1,
+    "type_delay": 1.0,
+    "always_on_top": True,
+    "window_position": None,
+    "whisper_model_size": "small",
+    "copy_clipboard": True,
+    "clear_clipboard_on_close": True,
+    "english_only": True,
+    "technical_filter": True,
+    "voice_commands": False,
+    "mic_muted": True,
+    "download_url": "https://openaipublic.azureedge.net/main/whisper/models",
+    "whisper_language": "en",
+    "whisper_temperature": 0.0,
+    "whisper_best_of": 5,
+    "whisper_beam_size": 5,
+    "whisper_no_speech_threshold": 0.6,
+    "whisper_word_timestamps": True,
+    "whisper_show_confidence": True
+})
+
+# Whisper settings returned together by get_all_whisper
+_WHISPER_KEYS = tuple(k for k in _DEFAULT_SETTINGS if k.startswith('whisper_'))
+
+# Accepted Whisper model families (suffixes like .en are allowed)
+_VALID_MODEL_BASES = frozenset({'tiny', 'base', 'small', 'medium', 'large'})
+
+# Display names for hotkey keys: combo keys, and single-key hotkeys
+_KEY_DISPLAY = MappingProxyType({
+    'space': 'Space',
+    'enter': 'Enter'
+})
+_BARE_KEY_DISPLAY = MappingProxyType({
+    'space': 'Space',
+    'enter': 'Enter',
+    'ctrl': 'Ctrl',
+    'alt': 'Alt',
+    'shift': 'Shift'
+})
+
+# Numeric settings clamped on write: key -> (cast, low, high)
+_VALIDATORS = MappingProxyType({
+    "type_delay": (float, 0.0, 5.0),
+    "whisper_temperature": (float, 0.0, 1.0),
+    "whisper_best_of": (int, 1, 10),
+    "whisper_beam_size": (int, 1, 10),
+    "whisper_no_speech_threshold": (float, 0.0, 1.0)
+})
+
+
+def _clamp(value: Any, cast: type, lo: Any, hi: Any) -> Any:
+    """Cast a setting value and clamp it to [lo, hi]"""
+    return max(lo, min(hi, cast(value)))
+
+
+def _dumps(obj: Dict[str, Any]) -> bytes:
+    """Serialize settings to indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse settings JSON bytes (orjson errors subclass json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class SettingsManager:
     """Manages application settings persistence"""
     
+    # Settings that must hold a bool
+    _BOOL_KEYS = frozenset({
+        'always_on_top', 'copy_clipboard', 'clear_clipboard_on_close',
+        'english_only', 'technical_filter', 'voice_commands', 'mic_muted',
+        'whisper_word_timestamps', 'whisper_show_confidence'
+    })
+    
     def __init__(self, settings_file: str = "v3_ptt_settings.json"):
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(script_dir)
-        self.settings_file = os.path.join(parent_dir, settings_file)
-        
-        if not os.path.exists(self.settings_file):
-            self.settings_file = os.path.join(script_dir, settings_file)
-        
-        # Default settings with type hints for validation
-        self.default_settings = {
-            "hotkey": {"type": "key", "key": "shift"},
-            "selected_device_index": -1,
-            "type_delay": 1.0,
-            "always_on_top": True,
-            "window_position": None,
-            "whisper_model_size": "small",
-            "copy_clipboard": True,
-            "clear_clipboard_on_close": True,
-            "english_only": True,
-            "technical_filter": True,
-            "voice_commands": False,
-            "mic_muted": True,
-            "download_url": "https://openaipublic.azureedge.net/main/whisper/models",
-            "whisper_language": "en",
-            "whisper_temperature": 0.0,
-            "whisper_best_of": 5,
-            "whisper_beam_size": 5,
-            "whisper_no_speech_threshold": 0.6,
-            "whisper_word_timestamps": True,
-            "whisper_show_confidence": True
-        }
-        
-        # Validation rules for settings
-        self.validators = {
-            "type_delay": lambda v: max(0.0, min(5.0, float(v))),
-            "whisper_temperature": lambda v: max(0.0, min(1.0, float(v))),
-            "whisper_best_of": lambda v: max(1, min(10, int(v))),
-            "whisper_beam_size": lambda v: max(1, min(10, int(v))),
-            "whisper_no_speech_threshold": lambda v: max(0.0, min(1.0, float(v)))
-        }
-        
-        self.settings = self.default_settings.copy()
-        self._load_settings()
-        self._clean_invalid_settings()
-        print(f"Settings file location: {self.settings_file}")
-    
-    def _load_settings(self):
-        """Load settings from JSON file"""
+        # Prefer a settings file next to the app folder, else inside it;
+        # _load_settings picks whichever opens (no separate exists() probe)
+        self._candidate_files = (
+            os.path.join(os.path.dirname(_SCRIPT_DIR), settings_file),
+            os.path.join(_SCRIPT_DIR, settings_file),
+        )
+        self._use_settings_file(self._candidate_files[1])
+        
+        # Defaults are a shared read-only layer under the user's overrides
+        self.default_settings = _DEFAULT_SETTINGS
+        
+        # Debounced writer state: setters mark dirty and (re)arm the timer
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dir_verified = False
+        atexit.register(self.flush)
+        
+        # (hotkey dict, display text) from the last get_hotkey_display_text
+        self._hotkey_display_cache = None
+        
+        # Lookups fall through to the defaults; writes land in maps[0]
+        self.settings = ChainMap({}, _DEFAULT_SETTINGS)
+        self._load_validate_clean()
+        log.debug("Settings file location: %s", self.settings_file)
+    
+    def _use_settings_file(self, path: str):
+        """Point at a settings file and cache the paths save_settings derives from it"""
+        self.settings_file = path
+        self._settings_dir = os.path.dirname(path)
+        self._settings_tmp = path + '.tmp'
+    
+    def _load_validate_clean(self):
+        """Load, prune and validate settings, then write the file at most once"""
+        dirty = self._load_settings()
+        dirty |= self._clean_invalid_settings()
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    self.settings = self.default_settings.copy()
-                    self.settings.update(loaded_settings)
-                    print(f"Settings loaded from {self.settings_file}")
-            else:
-                print(f"Settings file not found, using defaults")
-                self.save_settings()
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"❌ Settings JSON error: {e}")
-            print("Using default settings")
+            dirty |= self._fix_invalid_values()
+        except Exception as e:
+            log.warning("Settings validation error: %s", e)
+        if dirty:
             self.save_settings()
+    
+    def _load_settings(self) -> bool:
+        """Load settings from JSON file; returns True if the file needs rewriting"""
+        try:
+            for path in self._candidate_files:
+                try:
+                    f = open(path, 'rb')
+                except FileNotFoundError:
+                    continue
+                self._use_settings_file(path)
+                self._dir_verified = True  # It just opened from there
+                with f:
+                    loaded_settings = _loads(f.read())
+                if not isinstance(loaded_settings, dict):
+                    raise ValueError("settings file is not a JSON object")
+                self.settings = ChainMap(loaded_settings, _DEFAULT_SETTINGS)
+                log.debug("Settings loaded from %s", self.settings_file)
+                return False
+            log.debug("Settings file not found, using defaults")
+            return True
+        except (json.JSONDecodeError, ValueError) as e:
+            log.warning("Settings JSON error: %s; using default settings", e)
+            return True
         except Exception as e:
-            print(f"❌ Unexpected settings load error: {e}")
-            print("Using default settings")
+            log.warning("Unexpected settings load error: %s; using default settings", e)
+            return False
     
-    def _clean_invalid_settings(self):
-        """Remove invalid settings not in defaults"""
+    def _clean_invalid_settings(self) -> bool:
+        """Remove invalid settings not in defaults; returns True if any were removed"""
         try:
-            valid_keys = set(self.default_settings.keys())
-            current_keys = set(self.settings.keys())
-            invalid_keys = current_keys - valid_keys
+            # Dict views support set arithmetic directly
+            invalid_keys = self.settings.keys() - self.default_settings.keys()
+            if not invalid_keys:
+                return False
             
-            if invalid_keys:
-                print(f"Removing invalid settings keys: {invalid_keys}")
-                for key in invalid_keys:
-                    del self.settings[key]
-                self.save_settings()
+            log.debug("Removing invalid settings keys: %s", invalid_keys)
+            for key in invalid_keys:
+                del self.settings[key]
+            return True
         except Exception as e:
-            print(f"❌ Error cleaning settings: {e}")
+            log.warning("Error cleaning settings: %s", e)
+            return False
+    
+    def _fix_invalid_values(self) -> bool:
+        """Repair bad user values in place; returns True if anything changed
+        
+        Defaults are known-good, so only the override layer is checked.
+        """
+        overrides = self.settings.maps[0]
+        changed = False
+        
+        # Validate model size
+        model_size = overrides.get('whisper_model_size')
+        if model_size is not None and (not isinstance(model_size, str)
+                                       or model_size.split('.')[0] not in _VALID_MODEL_BASES):
+            overrides['whisper_model_size'] = 'base'
+            changed = True
+            log.debug("Fixed invalid model size: %s -> base", model_size)
+        
+        # Validate numeric values; unparseable ones fall back to the default
+        for key in _VALIDATORS.keys() & overrides.keys():
+            value = overrides[key]
+            try:
+                fixed = _clamp(value, *_VALIDATORS[key])
+            except (TypeError, ValueError):
+                del overrides[key]
+                changed = True
+                log.debug("Fixed invalid %s value", key)
+                continue
+            if type(fixed) is not type(value) or fixed != value:
+                overrides[key] = fixed
+                changed = True
+        
+        # Validate boolean values
+        for key in self._BOOL_KEYS & overrides.keys():
+            if not isinstance(overrides[key], bool):
+                del overrides[key]
+                changed = True
+                log.debug("Fixed invalid %s value", key)
+        
+        # Validate hotkey configuration
+        hotkey = overrides.get('hotkey', _MISSING)
+        if hotkey is not _MISSING and (not isinstance(hotkey, dict) or 'type' not in hotkey):
+            del overrides['hotkey']
+            changed = True
+            log.debug("Fixed invalid hotkey configuration")
+        
+        return changed
     
-    def save_settings(self):
-        """Save current settings to JSON file"""
+    def save_settings(self) -> bool:
+        """Save current settings to JSON file; returns True on success"""
         try:
-            os.makedirs(os.path.dirname(self.settings_file), exist_ok=True)
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
-            print(f"Settings saved to {self.settings_file}")
+            # The folder only needs creating once per settings file
+            if not self._dir_verified:
+                os.makedirs(self._settings_dir, exist_ok=True)
+                self._dir_verified = True
+            # Only the user's overrides are stored; copy first because the
+            # debounced flush runs on a timer thread
+            data = _dumps(dict(self.settings.maps[0]))
+            # Write a sibling temp file in one buffer, then rename over the
+            # real file so a crash mid-write never leaves truncated JSON
+            tmp_path = self._settings_tmp
+            with self._save_lock:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, self.settings_file)
+            log.debug("Settings saved to %s", self.settings_file)
+            return True
         except Exception as e:
-            print(f"❌ Settings save error: {e}")
+            log.warning("Settings save error: %s", e)
+            return False
+    
+    def _schedule_flush(self):
+        """Mark settings dirty and (re)start the coalescing write timer"""
+        with self._flush_lock:
+            self._dirty = True
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending setting changes to disk now (no-op if nothing changed)"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            # Stay dirty if the write failed so a later flush retries it
+            self._dirty = not self.save_settings()
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Generic getter for any setting"""
@@ -109,16 +300,60 @@ class SettingsManager:
     def set_setting(self, key: str, value: Any):
         """Generic setter with optional validation"""
         try:
-            if key in self.validators:
-                value = self.validators[key](value)
-            self.settings[key] = value
-            self.save_settings()
+            if self._apply_setting(key, value):
+                self._schedule_flush()
         except Exception as e:
-            print(f"Error setting {key}: {e}")
+            log.warning("Error setting %s: %s", key, e)
+    
+    def update_many(self, changes: Dict[str, Any]):
+        """Set several settings at once with a single (debounced) save"""
+        changed = False
+        for key, value in changes.items():
+            try:
+                changed |= self._apply_setting(key, value)
+            except Exception as e:
+                log.warning("Error setting %s: %s", key, e)
+        if changed:
+            self._schedule_flush()
+    
+    def _apply_setting(self, key: str, value: Any) -> bool:
+        """Validate and store one value in memory; returns True if it changed"""
+        rule = _VALIDATORS.get(key)
+        if rule is not None:
+            value = _clamp(value, *rule)
+        
+        # Nothing to write if the effective value is unchanged
+        current = self.settings.get(key, _MISSING)
+        if current is value:
+            # The same container may have been mutated in place
+            if not isinstance(value, (dict, list)):
+                return False
+        elif type(current) is type(value) and current == value:
+            return False
+        
+        # Keep the override layer a true delta: values equal to their
+        # default are dropped rather than stored
+        overrides = self.settings.maps[0]
+        default = _DEFAULT_SETTINGS.get(key, _MISSING)
+        if type(default) is type(value) and default == value:
+            overrides.pop(key, None)
+        else:
+            overrides[key] = value
+        if key == 'hotkey':
+            self._hotkey_display_cache = None
+        return True
+    
+    def get_all_whisper(self) -> Dict[str, Any]:
+        """All whisper_* settings in one call, keyed without the prefix
+        (e.g. 'temperature', 'beam_size')"""
+        settings = self.settings
+        return {key[8:]: settings[key] for key in _WHISPER_KEYS}
     
     # Specific getters/setters for commonly used settings
     def get_hotkey(self) -> Dict[str, Any]:
-        return self.get_setting('hotkey')
+        # A copy, so callers can't mutate the stored (or shared default) dict
+        hotkey = self.get_setting('hotkey')
+        return dict(hotkey) if isinstance(hotkey, dict) else hotkey
     
     def set_hotkey(self, hotkey_config: Dict[str, Any]):
         self.set_setting('hotkey', hotkey_config)
@@ -134,39 +369,47 @@ class SettingsManager:
         return self.get_setting('whisper_model_size', 'base')
     
     def set_whisper_model_size(self, size: str) -> bool:
-        base_model = size.split('.')[0]
-        valid_sizes = ['tiny', 'base', 'small', 'medium', 'large']
-        if base_model in valid_sizes:
+        if self.is_valid_model_size(size):
             self.set_setting('whisper_model_size', size)
             return True
-        print(f"❌ Invalid model size: {size} (base: {base_model})")
+        log.warning("Invalid model size: %s (base: %s)", size, size.split('.')[0])
         return False
     
+    @staticmethod
+    def is_valid_model_size(size: str) -> bool:
+        """True if size names a known Whisper model family (e.g. small, small.en)"""
+        return size.split('.')[0] in _VALID_MODEL_BASES
+    
     def get_hotkey_display_text(self) -> str:
         """Get display text for current hotkey"""
-        hotkey = self.get_hotkey()
-        if hotkey['type'] == 'key':
-            if 'combo' in hotkey:
-                combo = hotkey['combo']
-                modifier = combo.get('modifier', '').title()
-                key = combo.get('key', '')
-                
-                key_display = {
-                    'space': 'Space',
-                    'enter': 'Enter'
-                }.get(key, key.upper() if len(key) == 1 else key.title())
-                
-                return f"{modifier}+{key_display}"
-            
+        # The stored object, not get_hotkey()'s copy: reuse the last result
+        # while it is unchanged (set/reset also clear the cache)
+        hotkey = self.get_setting('hotkey')
+        cached = self._hotkey_display_cache
+        if cached is not None and cached[0] is hotkey:
+            return cached[1]
+        text = self._format_hotkey_display(hotkey)
+        self._hotkey_display_cache = (hotkey, text)
+        return text
+    
+    @staticmethod
+    def _format_hotkey_display(hotkey: Dict[str, Any]) -> str:
+        """Build the display text for a hotkey config"""
+        hotkey_type = hotkey['type']
+        
+        # Common case first: a single key, no combo
+        if hotkey_type == 'key' and 'combo' not in hotkey:
             key = hotkey.get('key', 'space')
-            return {
-                'space': 'Space',
-                'enter': 'Enter',
-                'ctrl': 'Ctrl',
-                'alt': 'Alt',
-                'shift': 'Shift'
-            }.get(key, key.upper())
-        elif hotkey['type'] == 'mouse':
+            return _BARE_KEY_DISPLAY.get(key) or key.upper()
+        
+        if hotkey_type == 'key':
+            combo = hotkey['combo']
+            modifier = combo.get('modifier', '').title()
+            key = combo.get('key', '')
+            key_display = _KEY_DISPLAY.get(key) or (key.upper() if len(key) == 1 else key.title())
+            return f"{modifier}+{key_display}"
+        
+        if hotkey_type == 'mouse':
             button = hotkey.get('button', 'left')
             return f"{button.title()} Click"
         return "Unknown"
@@ -174,61 +417,42 @@ class SettingsManager:
     def reset_to_defaults(self):
         """Reset all settings to default values"""
         try:
-            self.settings = self.default_settings.copy()
+            self.settings.maps[0].clear()
+            self._hotkey_display_cache = None
             self.save_settings()
-            print("Settings reset to defaults")
+            log.debug("Settings reset to defaults")
         except Exception as e:
-            print(f"❌ Error resetting settings: {e}")
+            log.warning("Error resetting settings: %s", e)
     
     def validate_settings(self) -> bool:
         """Validate current settings and fix issues"""
         try:
-            # Validate model size
-            model_size = self.get_setting('whisper_model_size', 'base')
-            base_model = model_size.split('.')[0]
-            if base_model not in ['tiny', 'base', 'small', 'medium', 'large']:
-                self.set_setting('whisper_model_size', 'base')
-                print(f"Fixed invalid model size: {model_size} -> base")
-            
-            # Validate numeric values
-            for key, validator in self.validators.items():
-                if key in self.settings:
-                    self.settings[key] = validator(self.settings[key])
-            
-            # Validate boolean values
-            bool_keys = ['always_on_top', 'copy_clipboard', 'clear_clipboard_on_close',
-                        'english_only', 'technical_filter', 'voice_commands', 'mic_muted',
-                        'whisper_word_timestamps', 'whisper_show_confidence']
-            for key in bool_keys:
-                if key in self.settings and not isinstance(self.settings[key], bool):
-                    self.settings[key] = self.default_settings[key]
-                    print(f"Fixed invalid {key} value")
-            
-            # Validate hotkey configuration
-            hotkey = self.get_setting('hotkey', {})
-            if not isinstance(hotkey, dict) or 'type' not in hotkey:
-                self.set_setting('hotkey', self.default_settings['hotkey'])
-                print("Fixed invalid hotkey configuration")
-            
-            self.save_settings()
+            if self._fix_invalid_values():
+                self.save_settings()
             return True
         except Exception as e:
-            print(f"❌ Settings validation error: {e}")
+            log.warning("Settings validation error: %s", e)
             return False
     
     # Dynamic attribute access for backward compatibility
     def __getattr__(self, name):
-        """Dynamic getter for settings using attribute access"""
+        """Dynamic getter for settings using attribute access
+        
+        The generated accessor is stored on the instance, so later lookups
+        find it directly and never reach __getattr__ again.
+        """
         if name.startswith('get_') and name != 'get_setting':
             key = name[4:]  # Remove 'get_' prefix
             # Return a method that gets the setting
             def getter():
                 return self.get_setting(key, self.default_settings.get(key))
+            self.__dict__[name] = getter
             return getter
         elif name.startswith('set_') and name != 'set_setting':
             key = name[4:]  # Remove 'set_' prefix
             # Return a method that sets the setting
             def setter(value):
                 return self.set_setting(key, value)
+            self.__dict__[name] = setter
             return setter
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
\ No newline at end of file
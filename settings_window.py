@@ -3,9 +3,282 @@
 # Purpose: GUI for adjusting application settings
 # Dependencies: tkinter, ttk
 
+import os
+import logging
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from typing import Callable, Optional
+from tkinter import ttk
+from tkinter import font as tkfont
+from typing import Callable, Dict, List, Optional, Tuple
+
+log = logging.getLogger('v3ptt.settings_window')
+
+# Named fonts shared by every widget in this window; Tk parses each spec
+# once instead of per widget. Created by _init_fonts once a Tk root exists.
+_FONT_TK = None
+_FONT_UI = _FONT_UI_BOLD = _FONT_HELP = None
+_FONT_MONO_BOLD = _FONT_TEXT = _FONT_TEXT_SMALL = None
+
+
+def _init_fonts(widget):
+    """Create the shared fonts for this widget's Tk interpreter (once)"""
+    global _FONT_TK, _FONT_UI, _FONT_UI_BOLD, _FONT_HELP
+    global _FONT_MONO_BOLD, _FONT_TEXT, _FONT_TEXT_SMALL
+    if _FONT_TK is widget.tk:
+        return
+    _FONT_UI = tkfont.Font(widget, family='Arial', size=9)
+    _FONT_UI_BOLD = tkfont.Font(widget, family='Arial', size=9, weight='bold')
+    _FONT_HELP = tkfont.Font(widget, family='Arial', size=8)
+    _FONT_MONO_BOLD = tkfont.Font(widget, family='Consolas', size=10, weight='bold')
+    _FONT_TEXT = tkfont.Font(widget, family='Courier', size=10)
+    _FONT_TEXT_SMALL = tkfont.Font(widget, family='Courier', size=9)
+    _FONT_TK = widget.tk
+
+
+# ttk button styles: name -> (resting, hover) background
+_BUTTON_COLORS = {
+    'Apply': ('#28a745', '#28a745'),
+    'Primary': ('#007bff', '#007bff'),
+    'Hotkey': ('#0066cc', '#0066cc'),
+    'Secondary': ('#6c757d', '#6c757d'),
+    'Refresh': ('#404040', '#007bff'),
+}
+_STYLES_TK = None
+
+
+def _install_styles(widget):
+    """Configure the shared ttk styles for this widget's Tk interpreter (once)"""
+    global _STYLES_TK
+    if _STYLES_TK is widget.tk:
+        return
+    style = ttk.Style(widget)
+    try:
+        style.theme_use('clam')
+    except tk.TclError:
+        pass
+    style.configure('Dark.TCombobox',
+                    fieldbackground='#2a2a2a',
+                    background='#2a2a2a',
+                    foreground='white',
+                    arrowcolor='white',
+                    bordercolor='#333',
+                    lightcolor='#333', darkcolor='#333',
+                    selectbackground='#404040',
+                    selectforeground='white')
+    style.map('Dark.TCombobox',
+              fieldbackground=[('readonly', '#2a2a2a')],
+              foreground=[('readonly', 'white')])
+    style.configure('Dark.TButton', foreground='white', font=_FONT_UI,
+                    relief='flat', borderwidth=0, padding=(6, 2))
+    for name, (bg, hover) in _BUTTON_COLORS.items():
+        style.configure(f'{name}.Dark.TButton', background=bg,
+                        bordercolor=bg, lightcolor=bg, darkcolor=bg)
+        style.map(f'{name}.Dark.TButton',
+                  background=[('active', hover)],
+                  foreground=[('active', 'white')])
+    style.configure('Refresh.Dark.TButton', font=_FONT_HELP)
+    _STYLES_TK = widget.tk
+
+
+# Settings window size, and its half extents for centering
+_WIN_W, _WIN_H = 640, 760
+_HALF_W, _HALF_H = _WIN_W // 2, _WIN_H // 2
+
+# Apply button resting label (restored after the "Applied!" flash)
+_APPLY_TEXT = "Apply"
+
+# Shared styling for the Options checkboxes
+_CHECK_STYLE = dict(fg='white', bg='#1a1a1a',
+                    selectcolor='#404040',
+                    activeforeground='white',
+                    activebackground='#1a1a1a',
+                    anchor='w',
+                    bd=0, highlightthickness=0,
+                    padx=0, pady=0)
+
+# Placeholder option shown when the models folder is empty
+_NO_MODELS = "No models available - Use Open Downloader"
+# Prefix of non-selectable separator entries in the model dropdown
+_SEP = "---"
+
+
+# models folder -> (mtime_ns, dropdown options) from its last scan
+_MODEL_OPTIONS_CACHE: Dict[str, Tuple[int, Tuple[List[str], Dict[str, str]]]] = {}
+
+
+def _scan_models_cached(model_manager, force: bool = False) -> Tuple[List[str], Dict[str, str]]:
+    """Build model dropdown options; an unchanged models folder (same mtime)
+    is not rescanned unless force is set"""
+    folder = model_manager.local_models_dir
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    cached = _MODEL_OPTIONS_CACHE.get(folder)
+    if not force and cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    # New folder state: skip the manager's short-lived listing snapshot
+    model_manager.invalidate_cache()
+    available_models = model_manager._scan_local_models()  # Only scan local folder
+    
+    # Show ALL models found in the folder (both standard and custom)
+    info = model_manager.model_info
+    name_to_display = {model: f"{model} ({info.get(model, {}).get('size', 'Unknown')})"
+                       for model in sorted(available_models)}
+    
+    # If no models available, show warning
+    model_options = list(name_to_display.values()) or [_NO_MODELS]
+    result = (model_options, name_to_display)
+    _MODEL_OPTIONS_CACHE[folder] = (mtime_ns, result)
+    return result
+
+
+# Cold-path dialogs, imported on first use and then kept
+_HOTKEY_CAPTURE = None
+_DOWNLOADER_WINDOW = None
+
+
+def _get_hotkey_capture() -> Callable:
+    """Resolve show_hotkey_capture once"""
+    global _HOTKEY_CAPTURE
+    if _HOTKEY_CAPTURE is None:
+        try:
+            from hotkey_capture import show_hotkey_capture
+        except ImportError:
+            # Fallback import path
+            from .hotkey_capture import show_hotkey_capture
+        _HOTKEY_CAPTURE = show_hotkey_capture
+    return _HOTKEY_CAPTURE
+
+
+def _get_downloader_window() -> type:
+    """Resolve DownloaderWindow once"""
+    global _DOWNLOADER_WINDOW
+    if _DOWNLOADER_WINDOW is None:
+        from downloader_window import DownloaderWindow
+        _DOWNLOADER_WINDOW = DownloaderWindow
+    return _DOWNLOADER_WINDOW
+
+
+# About content — commands first, details after
+ABOUT_TEXT = """🎙️ Voice Commands (enable in Options)
+=============================================
+Commands are recognized only at the END of what you say,
+so "I love enterprise" still types the whole sentence.
+Commands can chain — "hello enter enter" types "hello"
+and presses Enter twice.
+
+Single-word:
+  enter / return / new line ........ Enter
+  tab (or cab/tad) ................. Tab
+  backspace ........................ Backspace
+  escape / esc ..................... Escape
+  space ............................ Space
+  delete ........................... Delete
+  home, end ........................ Home / End
+  up, down, left, right ............ Arrow keys
+  page up, page down ............... PageUp / PageDown
+
+Modifier combos (say modifier + key):
+  control c / control v / control z
+  alt tab
+  shift tab
+  (any of: control, ctrl, alt, shift)
+
+Tip: when Voice Commands is enabled the app biases
+Whisper toward these words so short utterances like
+"tab" transcribe more reliably.
+
+
+🎙️ LoudMouth (Push-to-Talk) Application
+=============================================
+Version: 1.0
+Author: Sggin1 with collaboration from Claude
+
+✨ Features:
+• Offline speech recognition using OpenAI Whisper
+• Multiple model size options (tiny, base, small, medium, large)
+• Configurable hotkeys (keyboard & mouse)
+• Audio device selection
+• Clipboard integration
+• Always on top option
+• Advanced Whisper optimizations
+• English-only mode for better performance
+• Technical filter for programming/coding terms
+• Persistent settings
+• Model management & downloading
+
+🔧 Technical Details:
+• Built with Python, Tkinter, PyAudio
+• Uses OpenAI Whisper for transcription
+• HIPAA-compliant offline processing
+• Optimized for short audio clips
+• Memory-efficient resource management
+• Thread-safe audio handling
+
+⚙️ Whisper Optimizations:
+• Temperature control for deterministic results
+• Beam search for improved accuracy
+• Silence detection & noise filtering
+• Word-level timestamps
+• Confidence metrics
+• Multiple decoding attempts
+
+🚀 Performance Features:
+• Persistent audio streams
+• Asynchronous model loading
+• Efficient memory management
+• Resource leak prevention
+• Smart caching system
+
+📝 Usage:
+1. Select your preferred model size
+2. Configure your hotkey
+3. Choose audio input device
+4. Enable desired options
+5. Hold hotkey to record speech
+6. Release to transcribe
+
+For best performance, use English-only mode and select
+the smallest model that meets your accuracy requirements.
+
+Enjoy efficient, offline speech recognition!"""
+
+
+# Static parts of the Whisper Models dialog
+_MODEL_TABLE = """📊 Available Models:
+┌─────────┬────────────┬─────────┬──────────┬────────────┐
+│ Model   │ Parameters │ Size    │ Speed    │ Accuracy   │
+├─────────┼────────────┼─────────┼──────────┼────────────┤
+│ tiny    │ 39M        │ ~150MB  │ ~10x     │ Basic      │
+│ base    │ 74M        │ ~290MB  │ ~7x      │ Good       │
+│ small   │ 244M       │ ~967MB  │ ~4x      │ Better     │
+│ medium  │ 769M       │ ~3.0GB  │ ~2x      │ Very Good  │
+│ large   │ 1550M      │ ~6.0GB  │ 1x       │ Best       │
+└─────────┴────────────┴─────────┴──────────┴────────────┘"""
+
+_MODEL_TIPS = """💡 Recommendations:
+• For speed: Use tiny or base models
+• For accuracy: Use small or medium models
+• For best quality: Use large model (requires more RAM)
+• Enable English Only for 20-40% speed boost
+• Enable Technical Filter for coding/programming work
+• Use temperature=0.0 for deterministic results
+
+🔧 Technical Filter:
+Converts speech to programming terms:
+• "underscore" → "_"
+• "dot py" → ".py"
+• "open paren close paren" → "()"
+• "equals equals" → "=="
+• And 100+ more programming conversions
+
+📁 Model Locations:
+• Local bundled: ./models/
+• Downloaded cache: ~/.cache/whisper/
+
+Use the Model Downloader to pre-download models
+for faster startup times."""
 
 
 class SettingsWindow:
@@ -18,40 +291,33 @@ class SettingsWindow:
         self.hotkey_manager = hotkey_manager
         self.callback = callback
         
+        # Enumerate audio devices once per window (PortAudio query is slow);
+        # first match wins for duplicate names, as the old linear search did
+        self._devices = audio_handler.get_audio_devices()
+        self._device_by_name = {}
+        self._device_by_index = {}
+        for dev in self._devices:
+            self._device_by_name.setdefault(dev['name'], dev['index'])
+            self._device_by_index.setdefault(dev['index'], dev['name'])
+        
+        _init_fonts(parent)
+        _install_styles(parent)
+        
         # Create window
         self.window = tk.Toplevel(parent)
         self.window.title("Settings")
 
-        # Dark theme for ttk widgets (Combobox, etc.)
-        self._style = ttk.Style(self.window)
-        try:
-            self._style.theme_use('clam')
-        except tk.TclError:
-            pass
-        self._style.configure('Dark.TCombobox',
-                              fieldbackground='#2a2a2a',
-                              background='#2a2a2a',
-                              foreground='white',
-                              arrowcolor='white',
-                              bordercolor='#333',
-                              lightcolor='#333', darkcolor='#333',
-                              selectbackground='#404040',
-                              selectforeground='white')
-        self._style.map('Dark.TCombobox',
-                        fieldbackground=[('readonly', '#2a2a2a')],
-                        foreground=[('readonly', 'white')])
-        # Force listbox popup to dark too
+        # Force the Combobox listbox popup to dark too
         self.window.option_add('*TCombobox*Listbox.background', '#2a2a2a')
         self.window.option_add('*TCombobox*Listbox.foreground', 'white')
         self.window.option_add('*TCombobox*Listbox.selectBackground', '#404040')
         self.window.option_add('*TCombobox*Listbox.selectForeground', 'white')
-        self.window.geometry("640x760")
         self.window.minsize(560, 760)
         self.window.configure(bg='#1a1a1a')
         self.window.attributes('-topmost', True)
         self.window.resizable(True, True)
         
-        # Center on parent window
+        # Size and center on parent window
         self._center_on_parent()
         
         # Make modal and force on top of parent
@@ -61,6 +327,10 @@ class SettingsWindow:
         self.window.focus_force()
         self.window.after(100, lambda: self.window.attributes('-topmost', True))
         
+        # About / System Info dialogs are built on first open, then reused
+        self._about_window = None
+        self._info_window = None
+        
         # Create menu bar
         self._create_menu_bar()
         
@@ -84,15 +354,25 @@ class SettingsWindow:
     
     def _center_on_parent(self):
         """Center window on parent"""
-        parent_x = self.parent.winfo_x()
-        parent_y = self.parent.winfo_y()
-        parent_w = self.parent.winfo_width()
-        parent_h = self.parent.winfo_height()
-        
-        x = parent_x + (parent_w // 2) - 320  # half of 640
-        y = parent_y + (parent_h // 2) - 380  # half of 760
-
-        self.window.geometry(f"640x760+{x}+{y}")
+        # One round-trip: parse "WxH+X+Y" instead of four winfo_* queries
+        try:
+            wh, _, xy = self.parent.geometry().partition('+')
+            x_str, _, y_str = xy.partition('+')
+            w_str, _, h_str = wh.partition('x')
+            parent_x, parent_y = int(x_str), int(y_str)
+            parent_w, parent_h = int(w_str), int(h_str)
+        except ValueError:
+            # Unusual geometry string (e.g. "-X-Y" corner offsets)
+            parent_x = self.parent.winfo_x()
+            parent_y = self.parent.winfo_y()
+            parent_w = self.parent.winfo_width()
+            parent_h = self.parent.winfo_height()
+        
+        x = parent_x + (parent_w // 2) - _HALF_W
+        y = parent_y + (parent_h // 2) - _HALF_H
+
+        # Size and position in a single geometry call
+        self.window.geometry(f"{_WIN_W}x{_WIN_H}+{x}+{y}")
     
     def _create_menu_bar(self):
         """Create menu bar with About dropdown"""
@@ -141,32 +421,31 @@ class SettingsWindow:
     def _create_hotkey_section(self, parent):
         """Create hotkey configuration section"""
         hotkey_frame = tk.LabelFrame(parent, text="Hotkey", fg='white', bg='#1a1a1a',
-                                    font=('Arial', 9, 'bold'),
+                                    font=_FONT_UI_BOLD,
                                     bd=1, relief='flat', highlightthickness=0)
         hotkey_frame.pack(fill='x', pady=5)
         
         # Current hotkey display
         current_hotkey = self.settings.get_hotkey_display_text()
         self.hotkey_label = tk.Label(hotkey_frame, text=f"Current: {current_hotkey}",
-                                    fg='#00ccff', bg='#1a1a1a', font=('Consolas', 10, 'bold'))
+                                    fg='#00ccff', bg='#1a1a1a', font=_FONT_MONO_BOLD)
         self.hotkey_label.pack(pady=5)
         
         # Change hotkey button
-        change_btn = tk.Button(hotkey_frame, text="Change Hotkey",
-                              fg='white', bg='#0066cc', font=('Arial', 9),
-                              command=self._change_hotkey)
+        change_btn = ttk.Button(hotkey_frame, text="Change Hotkey",
+                               style='Hotkey.Dark.TButton',
+                               command=self._change_hotkey)
         change_btn.pack(pady=5)
     
     def _create_audio_section(self, parent):
         """Create audio device selection section"""
         audio_frame = tk.LabelFrame(parent, text="Audio Device", fg='white', bg='#1a1a1a',
-                                   font=('Arial', 9, 'bold'),
+                                   font=_FONT_UI_BOLD,
                                    bd=1, relief='flat', highlightthickness=0)
         audio_frame.pack(fill='x', pady=5)
         
         # Device dropdown
-        devices = self.audio_handler.get_audio_devices()
-        device_names = ["System Default"] + [dev['name'] for dev in devices]
+        device_names = ["System Default"] + [dev['name'] for dev in self._devices]
         
         self.device_dropdown = ttk.Combobox(audio_frame, textvariable=self.device_var,
                                            values=device_names, state='readonly',
@@ -176,20 +455,20 @@ class SettingsWindow:
     def _create_delay_section(self, parent):
         """Create post delay section - match hotkey section layout"""
         delay_frame = tk.LabelFrame(parent, text="Post Delay", fg='white', bg='#1a1a1a',
-                                   font=('Arial', 9, 'bold'),
+                                   font=_FONT_UI_BOLD,
                                    bd=1, relief='flat', highlightthickness=0)
         delay_frame.pack(fill='x', pady=5)
         
         # Current delay display (like hotkey section)
-        current_delay = f"{self.settings.get_type_delay():.1f} seconds"
+        current_delay = self._last_delay_str = f"{self.settings.get_type_delay():.1f} seconds"
         self.delay_display_label = tk.Label(delay_frame, text=f"Current: {current_delay}",
-                                           fg='#00ccff', bg='#1a1a1a', font=('Arial', 9))
+                                           fg='#00ccff', bg='#1a1a1a', font=_FONT_UI)
         self.delay_display_label.pack(pady=5)
         
         # Delay spinbox
         delay_spinbox = tk.Spinbox(delay_frame, from_=0.0, to=5.0, increment=0.1,
                                   textvariable=self.delay_var, width=10,
-                                  fg='white', bg='#404040', font=('Arial', 9),
+                                  fg='white', bg='#404040', font=_FONT_UI,
                                   command=self._update_delay_display)
         delay_spinbox.pack(pady=5)
         delay_spinbox.bind('<KeyRelease>', lambda e: self._update_delay_display())
@@ -197,7 +476,7 @@ class SettingsWindow:
     def _create_always_on_top_section(self, parent):
         """Create options section for always on top and future features"""
         options_frame = tk.LabelFrame(parent, text="Options", fg='white', bg='#1a1a1a',
-                                     font=('Arial', 9, 'bold'),
+                                     font=_FONT_UI_BOLD,
                                      bd=1, relief='flat', highlightthickness=0)
         options_frame.pack(fill='x', pady=5)
         
@@ -207,16 +486,6 @@ class SettingsWindow:
         checkboxes_container.columnconfigure(0, weight=1, uniform='opt')
         checkboxes_container.columnconfigure(1, weight=1, uniform='opt')
 
-        def _cb(parent, text, var):
-            return tk.Checkbutton(parent, text=text, variable=var,
-                                  fg='white', bg='#1a1a1a',
-                                  selectcolor='#404040',
-                                  activeforeground='white',
-                                  activebackground='#1a1a1a',
-                                  font=('Arial', 9), anchor='w',
-                                  bd=0, highlightthickness=0,
-                                  padx=0, pady=0)
-
         options = [
             ("Always on top",          self.always_on_top_var),
             ("Clear clipboard on exit", self.clear_clipboard_on_close_var),
@@ -227,34 +496,21 @@ class SettingsWindow:
         ]
         for i, (label, var) in enumerate(options):
             row, col = divmod(i, 2)
-            _cb(checkboxes_container, label, var).grid(
+            tk.Checkbutton(checkboxes_container, text=label, variable=var,
+                           font=_FONT_UI, **_CHECK_STYLE).grid(
                 row=row, column=col, sticky='w', padx=(0, 20), pady=2)
 
 
     def _create_model_size_section(self, parent):
         """Create model size selection section"""
         model_size_frame = tk.LabelFrame(parent, text="Model Selection", fg='white', bg='#1a1a1a',
-                                        font=('Arial', 9, 'bold'),
+                                        font=_FONT_UI_BOLD,
                                         bd=1, relief='flat', highlightthickness=0)
         model_size_frame.pack(fill='x', pady=5)
         
-        # Get available models from model manager (ONLY from models folder, not cache)
-        model_manager = self.audio_handler.model_manager
-        available_models = model_manager._scan_local_models()  # Only scan local folder
-        model_status = model_manager.get_model_status()
-        
-        # Create model options with sizes (only available models from folder)
-        model_options = []
-        
-        # Show ALL models found in the folder (both standard and custom)
-        for model in sorted(available_models):
-            model_info = model_manager.model_info.get(model, {})
-            size = model_info.get('size', 'Unknown')
-            model_options.append(f"{model} ({size})")
-        
-        # If no models available, show warning
-        if not model_options:
-            model_options = ["No models available - Use Open Downloader"]
+        # Model options (ONLY from models folder, not cache); the saved
+        # model is selected in _load_current_settings
+        model_options, self._model_name_to_display = self._build_model_options()
         
         # Create dropdown container with refresh capability
         dropdown_container = tk.Frame(model_size_frame, bg='#1a1a1a')
@@ -266,81 +522,35 @@ class SettingsWindow:
         self.model_size_dropdown.pack(side='left', fill='x', expand=True)
         
         # Add refresh button (clearer text)
-        refresh_btn = tk.Button(dropdown_container, text="Refresh", fg='white', bg='#404040', 
-                               font=('Arial', 8), width=8, height=1,
-                               relief='flat', bd=0,
-                               command=self._refresh_model_dropdown)
+        # (hover highlight comes from the style's 'active' map)
+        refresh_btn = ttk.Button(dropdown_container, text="Refresh", width=8,
+                                style='Refresh.Dark.TButton',
+                                command=self._refresh_model_dropdown)
         refresh_btn.pack(side='right', padx=(5, 0))
         
-        # Tooltip-like help
-        def on_enter(e):
-            refresh_btn.config(bg='#007bff')
-        def on_leave(e):
-            refresh_btn.config(bg='#404040')
-            
-        refresh_btn.bind("<Enter>", on_enter)
-        refresh_btn.bind("<Leave>", on_leave)
-        
         # Add helper text
         helper_text = tk.Label(model_size_frame, text="Drop .pt files in models/ folder and click Refresh to detect them",
-                              fg='#888888', bg='#1a1a1a', font=('Arial', 8))
+                              fg='#888888', bg='#1a1a1a', font=_FONT_HELP)
         helper_text.pack(pady=(0, 5))
-        
-        # Load current model size
-        current_model_size = self.settings.get_whisper_model_size()
-        if current_model_size and model_options and model_options[0] != "No models available - Use Open Downloader":
-            # Find the matching option (only among available models)
-            for option in model_options:
-                if option.startswith(current_model_size) and not option.startswith("---"):
-                    self.model_size_dropdown.set(option)
-                    break
-            else:
-                # Current model not available, select first available (skip separator)
-                for option in model_options:
-                    if not option.startswith("---") and option != "No models available - Use Open Downloader":
-                        self.model_size_dropdown.set(option)
-                        break
-        else:
-            # Default to first available model (base should be there for distribution)
-            for option in model_options:
-                if not option.startswith("---") and option != "No models available - Use Open Downloader":
-                    self.model_size_dropdown.set(option)
-                    break
     
     def _refresh_model_dropdown(self):
         """Refresh the model dropdown with current available models"""
         if not hasattr(self, 'model_size_dropdown'):
             return
             
-        # Get available models from model manager (ONLY from models folder, not cache)
-        model_manager = self.audio_handler.model_manager
-        available_models = model_manager._scan_local_models()  # Only scan local folder
-        model_status = model_manager.get_model_status()
-        
-        # Create model options with sizes (only available models from folder)
-        model_options = []
-        
-        # Show ALL models found in the folder (both standard and custom)
-        for model in sorted(available_models):
-            model_info = model_manager.model_info.get(model, {})
-            size = model_info.get('size', 'Unknown')
-            model_options.append(f"{model} ({size})")
-        
-        # If no models available, show warning
-        if not model_options:
-            model_options = ["No models available - Use Open Downloader"]
+        # Refresh must see newly dropped files, whatever the folder mtime says
+        model_options, self._model_name_to_display = self._build_model_options(force=True)
         
         # Update dropdown values
         self.model_size_dropdown['values'] = model_options
         
-        # Update selection if current model is still available
-        current_selection = self.model_size_var.get()
-        if current_selection not in model_options:
-            # Select first available option if current selection is not valid
-            for option in model_options:
-                if not option.startswith("---") and option != "No models available - Use Open Downloader":
-                    self.model_size_dropdown.set(option)
-                    break
+        # Select first available option if current selection is not valid
+        if self.model_size_var.get() not in model_options and self._model_name_to_display:
+            self.model_size_dropdown.set(model_options[0])
+    
+    def _build_model_options(self, force: bool = False) -> Tuple[List[str], Dict[str, str]]:
+        """Return (dropdown options, {model name: option}) for the models folder"""
+        return _scan_models_cached(self.audio_handler.model_manager, force)
     
     def _create_buttons(self, parent):
         """Create action buttons"""
@@ -348,24 +558,22 @@ class SettingsWindow:
         button_frame.pack(fill='x', pady=15)  # Increased padding
         
         # Apply button (was Save - more intuitive for model changes)
-        apply_btn = tk.Button(button_frame, text="Apply",
-                             fg='white', bg='#28a745', font=('Arial', 9),
-                             width=8, height=1, relief='flat', bd=0,
-                             command=self._save_settings)
-        apply_btn.pack(side='left', padx=5)
+        self._apply_text_var = tk.StringVar(self.window, value=_APPLY_TEXT)
+        self.apply_btn = ttk.Button(button_frame, textvariable=self._apply_text_var,
+                                   width=8, style='Apply.Dark.TButton',
+                                   command=self._save_settings)
+        self.apply_btn.pack(side='left', padx=5)
         
         # Open Downloader button (wider as requested)
-        downloader_btn = tk.Button(button_frame, text="Open Downloader",
-                                  fg='white', bg='#007bff', font=('Arial', 9),
-                                  width=15, height=1, relief='flat', bd=0,
-                                  command=self._open_downloader)
+        downloader_btn = ttk.Button(button_frame, text="Open Downloader", width=15,
+                                   style='Primary.Dark.TButton',
+                                   command=self._open_downloader)
         downloader_btn.pack(side='left', padx=5)
         
         # Close button (was Cancel)
-        close_btn = tk.Button(button_frame, text="Close",
-                             fg='white', bg='#6c757d', font=('Arial', 9),
-                             width=8, height=1, relief='flat', bd=0,
-                             command=self._on_close)
+        close_btn = ttk.Button(button_frame, text="Close", width=8,
+                              style='Secondary.Dark.TButton',
+                              command=self._on_close)
         close_btn.pack(side='right', padx=5)
     
     def _load_current_settings(self):
@@ -376,11 +584,9 @@ class SettingsWindow:
         if current_device is None:
             self.device_var.set("System Default")
         else:
-            devices = self.audio_handler.get_audio_devices()
-            for dev in devices:
-                if dev['index'] == current_device:
-                    self.device_var.set(dev['name'])
-                    break
+            device_name = self._device_by_index.get(current_device)
+            if device_name is not None:
+                self.device_var.set(device_name)
         
         # Post delay
         self.delay_var.set(self.settings.get_type_delay())
@@ -403,20 +609,20 @@ class SettingsWindow:
         # Voice commands (default False)
         self.voice_commands_var.set(self.settings.get_voice_commands())
         
-        # Model size
+        # Model size: O(1) lookup of the saved model's dropdown entry, else the
+        # first available model, else the bare name
         current_model_size = self.settings.get_whisper_model_size()
-        if current_model_size:
-            self.model_size_var.set(current_model_size)
-        else:
-            self.model_size_var.set("base") # Default to base (more stable than small)
+        name_to_display = self._model_name_to_display
+        display = name_to_display.get(current_model_size) if current_model_size else None
+        if display is None and name_to_display:
+            display = next(iter(name_to_display.values()))
+        if display is None:
+            display = current_model_size or "base"  # Default to base (more stable than small)
+        self.model_size_var.set(display)
     
     def _change_hotkey(self):
         """Change hotkey using dedicated capture module"""
-        try:
-            from hotkey_capture import show_hotkey_capture
-        except ImportError:
-            # Fallback import path
-            from .hotkey_capture import show_hotkey_capture
+        show_hotkey_capture = _get_hotkey_capture()
         
         def on_hotkey_changed():
             """Callback when hotkey is changed"""
@@ -436,77 +642,62 @@ class SettingsWindow:
     def _save_settings(self):
         """Apply all settings (but keep window open)"""
         try:
-            print("Applying settings...")  # Debug
+            log.debug("Applying settings")
+            prev_model = self.settings.get_whisper_model_size()
+            
+            # Collect everything first, then hand it over in one batch
+            changes = {
+                'type_delay': self.delay_var.get(),
+                'always_on_top': self.always_on_top_var.get(),
+                'clear_clipboard_on_close': self.clear_clipboard_on_close_var.get(),
+                'copy_clipboard': self.copy_clipboard_var.get(),
+                'english_only': self.english_only_var.get(),
+                'technical_filter': self.technical_filter_var.get(),
+                'voice_commands': self.voice_commands_var.get(),
+            }
             
-            # Save audio device
+            # Audio device (-1 stores "System Default")
             selected_device = self.device_var.get()
             if selected_device == "System Default":
-                self.settings.set_device_index(None)
+                changes['selected_device_index'] = -1
                 device_success = True
             else:
-                devices = self.audio_handler.get_audio_devices()
-                device_found = False
-                for dev in devices:
-                    if dev['name'] == selected_device:
-                        self.settings.set_device_index(dev['index'])
-                        device_found = True
-                        break
-                device_success = device_found
-            
-            # Save post delay
-            self.settings.set_type_delay(self.delay_var.get())
-            self._update_delay_display()  # Update display
-            delay_success = True
-            
-            # Save always on top
-            self.settings.set_always_on_top(self.always_on_top_var.get())
-            ontop_success = True
-            
-            # Save clear clipboard on close
-            self.settings.set_clear_clipboard_on_close(self.clear_clipboard_on_close_var.get())
-            clear_clipboard_success = True
-            
-            # Save copy to clipboard
-            self.settings.set_copy_clipboard(self.copy_clipboard_var.get())
-            clipboard_success = True
+                device_index = self._device_by_name.get(selected_device)
+                if device_index is not None:
+                    changes['selected_device_index'] = device_index
+                device_success = device_index is not None
             
-            # Save English Only setting
-            self.settings.set_english_only(self.english_only_var.get())
-            english_only_success = True
-            
-            # Save technical filter setting
-            self.settings.set_technical_filter(self.technical_filter_var.get())
-            technical_filter_success = True
-
-            # Save voice commands setting
-            self.settings.set_voice_commands(self.voice_commands_var.get())
-            
-            # Save model size (extract model name from format like "small (967MB)")
+            # Model size (extract model name from format like "small (967MB)")
             selected_model_display = self.model_size_var.get()
-            if (selected_model_display and 
-                not selected_model_display.startswith("No models available") and
-                not selected_model_display.startswith("---")):
+            model_success = False
+            if (selected_model_display and
+                    selected_model_display != _NO_MODELS and
+                    not selected_model_display.startswith(_SEP)):
                 # Extract model name from display format
-                model_name = selected_model_display.split(' ')[0]
-                model_success = self.settings.set_whisper_model_size(model_name)
-            else:
-                model_success = False
+                model_name = selected_model_display.partition(' ')[0]
+                model_success = self.settings.is_valid_model_size(model_name)
+                if model_success:
+                    changes['whisper_model_size'] = model_name
             
-            print(f"Apply results: device={device_success}, delay={delay_success}, ontop={ontop_success}, clear_clipboard={clear_clipboard_success}, clipboard={clipboard_success}, english_only={english_only_success}, model_size={model_success}")  # Debug
+            self.settings.update_many(changes)
+            self._update_delay_display()  # Update display
+            
+            log.debug("Apply results: device=%s, model_size=%s, values=%s",
+                      device_success, model_success, changes)
             
             # Notify callback to apply settings
             if self.callback:
                 self.callback()
             
-            # If model size changed, reload the model
-            if model_success:
+            # Reload only if the model size actually changed (loading is slow)
+            if model_success and model_name != prev_model:
                 self.audio_handler.reload_model()
             
             # Show apply confirmation
             self._show_save_confirmation()
             
         except Exception as e:
-            print(f"Apply error: {e}")  # Debug
+            log.exception("Apply error")
             # Use status message instead of dialog
             if hasattr(self, 'parent') and hasattr(self.parent, 'master'):
                 # Find the main app status update
@@ -514,47 +705,38 @@ class SettingsWindow:
     
     def _show_save_confirmation(self):
         """Show apply confirmation on button"""
-        # Find apply button more efficiently
-        def find_apply_button(widget):
-            if isinstance(widget, tk.Button) and widget['text'] == 'Apply':
-                return widget
-            for child in widget.winfo_children():
-                result = find_apply_button(child)
-                if result:
-                    return result
-            return None
-        
-        apply_btn = find_apply_button(self.window)
-        if apply_btn:
-            original_text = apply_btn['text']
-            original_bg = apply_btn['bg']
-            apply_btn.config(text="Applied!", bg='#28a745')
-            self.window.after(1500, lambda: apply_btn.config(text=original_text, bg=original_bg))
+        self._apply_text_var.set("Applied!")
+        self.window.after(1500, self._apply_text_var.set, _APPLY_TEXT)
     
     def _update_delay_display(self):
-        """Update the delay display label"""
+        """Update the delay display label (skips the Tk call if unchanged)"""
         try:
             current_delay = f"{self.delay_var.get():.1f} seconds"
-            self.delay_display_label.config(text=f"Current: {current_delay}")
         except Exception:
-            pass
+            return
+        if current_delay == self._last_delay_str:
+            return
+        self._last_delay_str = current_delay
+        self.delay_display_label.config(text=f"Current: {current_delay}")
     
     def _open_downloader(self):
         """Open the model downloader GUI"""
         try:
-            from downloader_window import DownloaderWindow
-            downloader = DownloaderWindow(self.window)
+            downloader = _get_downloader_window()(
+                self.window, model_manager=self.audio_handler.model_manager)
         except Exception as e:
+            from tkinter import messagebox  # Only needed on this error path
             messagebox.showerror("Error", f"Failed to open downloader: {str(e)}")
     
     def _show_about_dialog(self):
         """Show about dialog"""
-        about_window = tk.Toplevel(self.window)
+        if self._reshow_dialog(self._about_window):
+            return
+        about_window = self._about_window = tk.Toplevel(self.window)
         about_window.title("About LoudMouth")
         about_window.geometry("1024x800")
         about_window.minsize(560, 500)
         about_window.configure(bg='#1a1a1a')
-        about_window.attributes('-topmost', True)
         about_window.resizable(True, True)
 
         # Center on settings window
@@ -562,9 +744,9 @@ class SettingsWindow:
         y = self.window.winfo_y() + 50
         about_window.geometry(f"1024x800+{x}+{y}")
         
-        # Make modal
+        # Read-only; the Settings window's grab already covers this child
         about_window.transient(self.window)
-        about_window.grab_set()
+        about_window.bind('<Escape>', lambda e: self._hide_dialog(about_window))
         
         # Create scrollable text widget
         text_frame = tk.Frame(about_window, bg='#1a1a1a')
@@ -572,7 +754,7 @@ class SettingsWindow:
         
         # Text widget with scrollbar
         text_widget = tk.Text(text_frame, bg='#2b2b2b', fg='white', 
-                             font=('Courier', 10), wrap=tk.WORD,
+                             font=_FONT_TEXT, wrap=tk.WORD,
                              borderwidth=0, highlightthickness=0)
         scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
@@ -581,111 +763,28 @@ class SettingsWindow:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # About content — commands first, details after
-        about_text = """🎙️ Voice Commands (enable in Options)
-=============================================
-Commands are recognized only at the END of what you say,
-so "I love enterprise" still types the whole sentence.
-Commands can chain — "hello enter enter" types "hello"
-and presses Enter twice.
-
-Single-word:
-  enter / return / new line ........ Enter
-  tab (or cab/tad) ................. Tab
-  backspace ........................ Backspace
-  escape / esc ..................... Escape
-  space ............................ Space
-  delete ........................... Delete
-  home, end ........................ Home / End
-  up, down, left, right ............ Arrow keys
-  page up, page down ............... PageUp / PageDown
-
-Modifier combos (say modifier + key):
-  control c / control v / control z
-  alt tab
-  shift tab
-  (any of: control, ctrl, alt, shift)
-
-Tip: when Voice Commands is enabled the app biases
-Whisper toward these words so short utterances like
-"tab" transcribe more reliably.
-
-
-🎙️ LoudMouth (Push-to-Talk) Application
-=============================================
-Version: 1.0
-Author: Sggin1 with collaboration from Claude
-
-✨ Features:
-• Offline speech recognition using OpenAI Whisper
-• Multiple model size options (tiny, base, small, medium, large)
-• Configurable hotkeys (keyboard & mouse)
-• Audio device selection
-• Clipboard integration
-• Always on top option
-• Advanced Whisper optimizations
-• English-only mode for better performance
-• Technical filter for programming/coding terms
-• Persistent settings
-• Model management & downloading
-
-🔧 Technical Details:
-• Built with Python, Tkinter, PyAudio
-• Uses OpenAI Whisper for transcription
-• HIPAA-compliant offline processing
-• Optimized for short audio clips
-• Memory-efficient resource management
-• Thread-safe audio handling
-
-⚙️ Whisper Optimizations:
-• Temperature control for deterministic results
-• Beam search for improved accuracy
-• Silence detection & noise filtering
-• Word-level timestamps
-• Confidence metrics
-• Multiple decoding attempts
-
-🚀 Performance Features:
-• Persistent audio streams
-• Asynchronous model loading
-• Efficient memory management
-• Resource leak prevention
-• Smart caching system
-
-📝 Usage:
-1. Select your preferred model size
-2. Configure your hotkey
-3. Choose audio input device
-4. Enable desired options
-5. Hold hotkey to record speech
-6. Release to transcribe
-
-For best performance, use English-only mode and select
-the smallest model that meets your accuracy requirements.
-
-Enjoy efficient, offline speech recognition!"""
         
-        text_widget.insert(tk.END, about_text)
+        text_widget.insert(tk.END, ABOUT_TEXT)
         text_widget.configure(state='disabled')
         
-        # Close button
-        close_btn = tk.Button(about_window, text="Close", 
-                             fg='white', bg='#6c757d', font=('Arial', 9),
-                             command=about_window.destroy)
+        # Close button (hides; the dialog is reused on the next open)
+        close_btn = ttk.Button(about_window, text="Close",
+                              style='Secondary.Dark.TButton',
+                              command=lambda: self._hide_dialog(about_window))
         close_btn.pack(pady=10)
+        about_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(about_window))
     
     def _show_system_info(self):
         """Show system information dialog"""
-        import platform
-        import sys
-        import os
+        if self._reshow_dialog(self._info_window):
+            self._set_dialog_text(self._info_text_widget, self._system_info_text())
+            return
         
-        info_window = tk.Toplevel(self.window)
+        info_window = self._info_window = tk.Toplevel(self.window)
         info_window.title("System Information")
         info_window.geometry("640x560")
         info_window.minsize(520, 420)
         info_window.configure(bg='#1a1a1a')
-        info_window.attributes('-topmost', True)
         info_window.resizable(True, True)
 
         # Center on settings window
@@ -693,16 +792,16 @@ Enjoy efficient, offline speech recognition!"""
         y = self.window.winfo_y() + 60
         info_window.geometry(f"640x560+{x}+{y}")
         
-        # Make modal
+        # Read-only; the Settings window's grab already covers this child
         info_window.transient(self.window)
-        info_window.grab_set()
+        info_window.bind('<Escape>', lambda e: self._hide_dialog(info_window))
         
         # Create scrollable text widget
         text_frame = tk.Frame(info_window, bg='#1a1a1a')
         text_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         text_widget = tk.Text(text_frame, bg='#2b2b2b', fg='white', 
-                             font=('Courier', 9), wrap=tk.WORD,
+                             font=_FONT_TEXT_SMALL, wrap=tk.WORD,
                              borderwidth=0, highlightthickness=0)
         scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
@@ -710,53 +809,82 @@ Enjoy efficient, offline speech recognition!"""
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        self._info_text_widget = text_widget
+        self._set_dialog_text(text_widget, self._system_info_text())
+        
+        # Close button (hides; the dialog is reused on the next open)
+        close_btn = ttk.Button(info_window, text="Close",
+                              style='Secondary.Dark.TButton',
+                              command=lambda: self._hide_dialog(info_window))
+        close_btn.pack(pady=10)
+        info_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(info_window))
+    
+    def _system_info_text(self) -> str:
+        """Build the System Info text (settings may have changed since last open)"""
+        import platform
+        import sys
+        
         # System info content
         try:
-            # Get audio devices
-            devices = self.audio_handler.get_audio_devices()
-            device_list = "\n".join([f"  {i}: {dev['name']}" for i, dev in enumerate(devices)])
+            # Reuse the device list enumerated when the window opened
+            device_list = "\n".join([f"  {i}: {dev['name']}" for i, dev in enumerate(self._devices)])
             
             # Get settings info
             current_model = self.settings.get_whisper_model_size()
             
-            system_info = f"""🖥️ System Information
-=====================
-
-Platform: {platform.system()} {platform.release()}
-Architecture: {platform.machine()}
-Python Version: {sys.version.split()[0]}
-Working Directory: {os.getcwd()}
-
-🎵 Audio Devices:
-{device_list}
-
-🤖 Whisper Configuration:
-Current Model: {current_model}
-Model Status: {self.audio_handler.get_model_quick_status()}
-English Only: {'✅ Enabled' if self.settings.get_english_only() else '❌ Disabled'}
-
-⚙️ Settings:
-Always On Top: {'✅' if self.settings.get_always_on_top() else '❌'}
-Copy to Clipboard: {'✅' if self.settings.get_copy_clipboard() else '❌'}
-Clear Clipboard on Close: {'✅' if self.settings.get_clear_clipboard_on_close() else '❌'}
-Technical Filter: {'✅ Enabled' if self.settings.get_technical_filter() else '❌ Disabled'}
-Post Delay: {self.settings.get_type_delay()}s
-Hotkey: {self.settings.get_hotkey_display_text()}
-
-📁 Paths:
-Settings: {self.settings.settings_file}
-Models Cache: ~/.cache/whisper/"""
+            system_info = "\n".join([
+                "🖥️ System Information",
+                "=====================",
+                "",
+                f"Platform: {platform.system()} {platform.release()}",
+                f"Architecture: {platform.machine()}",
+                f"Python Version: {sys.version.split()[0]}",
+                f"Working Directory: {os.getcwd()}",
+                "",
+                "🎵 Audio Devices:",
+                device_list,
+                "",
+                "🤖 Whisper Configuration:",
+                f"Current Model: {current_model}",
+                f"Model Status: {self.audio_handler.get_model_quick_status()}",
+                f"English Only: {'✅ Enabled' if self.settings.get_english_only() else '❌ Disabled'}",
+                "",
+                "⚙️ Settings:",
+                f"Always On Top: {'✅' if self.settings.get_always_on_top() else '❌'}",
+                f"Copy to Clipboard: {'✅' if self.settings.get_copy_clipboard() else '❌'}",
+                f"Clear Clipboard on Close: {'✅' if self.settings.get_clear_clipboard_on_close() else '❌'}",
+                f"Technical Filter: {'✅ Enabled' if self.settings.get_technical_filter() else '❌ Disabled'}",
+                f"Post Delay: {self.settings.get_type_delay()}s",
+                f"Hotkey: {self.settings.get_hotkey_display_text()}",
+                "",
+                "📁 Paths:",
+                f"Settings: {self.settings.settings_file}",
+                "Models Cache: ~/.cache/whisper/",
+            ])
         except Exception as e:
             system_info = f"Error gathering system info: {str(e)}"
-        
-        text_widget.insert(tk.END, system_info)
+        return system_info
+    
+    @staticmethod
+    def _set_dialog_text(text_widget, content: str):
+        """Replace the contents of a read-only dialog Text widget"""
+        text_widget.configure(state='normal')
+        text_widget.delete('1.0', tk.END)
+        text_widget.insert(tk.END, content)
         text_widget.configure(state='disabled')
-        
-        # Close button
-        close_btn = tk.Button(info_window, text="Close", 
-                             fg='white', bg='#6c757d', font=('Arial', 9),
-                             command=info_window.destroy)
-        close_btn.pack(pady=10)
+    
+    def _reshow_dialog(self, dialog) -> bool:
+        """Bring back a previously built dialog; False if it needs building"""
+        if dialog is None or not dialog.winfo_exists():
+            return False
+        dialog.deiconify()
+        dialog.lift()
+        return True
+    
+    @staticmethod
+    def _hide_dialog(dialog):
+        """Hide a reusable dialog instead of destroying it"""
+        dialog.withdraw()
     
     def _show_model_info(self):
         """Show Whisper model information"""
@@ -782,7 +910,7 @@ Models Cache: ~/.cache/whisper/"""
         text_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         text_widget = tk.Text(text_frame, bg='#2b2b2b', fg='white', 
-                             font=('Courier', 9), wrap=tk.WORD,
+                             font=_FONT_TEXT_SMALL, wrap=tk.WORD,
                              borderwidth=0, highlightthickness=0)
         scrollbar = tk.Scrollbar(text_frame, orient=tk.VERTICAL, command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
@@ -792,57 +920,30 @@ Models Cache: ~/.cache/whisper/"""
         
         # Model info content
         try:
-            current_model = self.settings.get_whisper_model_size()
+            whisper = self.settings.get_all_whisper()
+            current_model = whisper['model_size']
             
-            model_info = f"""🤖 Whisper Model Information
-============================
-
-Currently Active: {current_model}
-Status: {self.audio_handler.get_model_quick_status()}
-
-📊 Available Models:
-┌─────────┬────────────┬─────────┬──────────┬────────────┐
-│ Model   │ Parameters │ Size    │ Speed    │ Accuracy   │
-├─────────┼────────────┼─────────┼──────────┼────────────┤
-│ tiny    │ 39M        │ ~150MB  │ ~10x     │ Basic      │
-│ base    │ 74M        │ ~290MB  │ ~7x      │ Good       │
-│ small   │ 244M       │ ~967MB  │ ~4x      │ Better     │
-│ medium  │ 769M       │ ~3.0GB  │ ~2x      │ Very Good  │
-│ large   │ 1550M      │ ~6.0GB  │ 1x       │ Best       │
-└─────────┴────────────┴─────────┴──────────┴────────────┘
-
-🔧 Current Whisper Settings:
-• English Only: {'✅ Enabled' if self.settings.get_english_only() else '❌ Disabled'}
-• Technical Filter: {'✅ Enabled' if self.settings.get_technical_filter() else '❌ Disabled'}
-• Temperature: {self.settings.get_whisper_temperature()}
-• Best Of: {self.settings.get_whisper_best_of()}
-• Beam Size: {self.settings.get_whisper_beam_size()}
-• No Speech Threshold: {self.settings.get_whisper_no_speech_threshold()}
-• Word Timestamps: {'✅' if self.settings.get_whisper_word_timestamps() else '❌'}
-• Show Confidence: {'✅' if self.settings.get_whisper_show_confidence() else '❌'}
-
-💡 Recommendations:
-• For speed: Use tiny or base models
-• For accuracy: Use small or medium models
-• For best quality: Use large model (requires more RAM)
-• Enable English Only for 20-40% speed boost
-• Enable Technical Filter for coding/programming work
-• Use temperature=0.0 for deterministic results
-
-🔧 Technical Filter:
-Converts speech to programming terms:
-• "underscore" → "_"
-• "dot py" → ".py"
-• "open paren close paren" → "()"
-• "equals equals" → "=="
-• And 100+ more programming conversions
-
-📁 Model Locations:
-• Local bundled: ./models/
-• Downloaded cache: ~/.cache/whisper/
-
-Use the Model Downloader to pre-download models
-for faster startup times."""
+            model_info = "\n".join([
+                "🤖 Whisper Model Information",
+                "============================",
+                "",
+                f"Currently Active: {current_model}",
+                f"Status: {self.audio_handler.get_model_quick_status()}",
+                "",
+                _MODEL_TABLE,
+                "",
+                "🔧 Current Whisper Settings:",
+                f"• English Only: {'✅ Enabled' if self.settings.get_english_only() else '❌ Disabled'}",
+                f"• Technical Filter: {'✅ Enabled' if self.settings.get_technical_filter() else '❌ Disabled'}",
+                f"• Temperature: {whisper['temperature']}",
+                f"• Best Of: {whisper['best_of']}",
+                f"• Beam Size: {whisper['beam_size']}",
+                f"• No Speech Threshold: {whisper['no_speech_threshold']}",
+                f"• Word Timestamps: {'✅' if whisper['word_timestamps'] else '❌'}",
+                f"• Show Confidence: {'✅' if whisper['show_confidence'] else '❌'}",
+                "",
+                _MODEL_TIPS,
+            ])
         except Exception as e:
             model_info = f"Error gathering model info: {str(e)}"
         
@@ -850,9 +951,9 @@ for faster startup times."""
         text_widget.configure(state='disabled')
         
         # Close button
-        close_btn = tk.Button(model_window, text="Close", 
-                             fg='white', bg='#6c757d', font=('Arial', 9),
-                             command=model_window.destroy)
+        close_btn = ttk.Button(model_window, text="Close",
+                              style='Secondary.Dark.TButton',
+                              command=model_window.destroy)
         close_btn.pack(pady=10)
     
     def _on_close(self):
@@ -3,8 +3,436 @@ Text Normalizer for Voice-to-Text Coding
 Handles technical word replacements and programming-specific normalization
 """
 
+import functools
+import logging
 import re
-from typing import Dict, List, Tuple
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+log = logging.getLogger('v3ptt.text_normalizer')
+
+# Post-processing patterns, compiled once at import
+_RE_EXT = re.compile(r'\s*\.\s*([a-zA-Z]{1,4})\b')
+_RE_DIGIT_RUN = re.compile(r'\b\d(?:\s+\d\b)+')
+_RE_WS = re.compile(r'\s{2,}')
+
+# Built-in rule tables, shared read-only by every TextNormalizer; an
+# instance copies a table only when a custom rule is added to it
+
+# Case-insensitive normalization rules
+_NORMALIZATION_RULES = MappingProxyType({
+    # Basic symbols
+    "underscore": "_",
+    "under score": "_",
+    "dash": "-",
+    "hyphen": "-",
+    "equals": "=",
+    "equal": "=",
+    "plus": "+",
+    "minus": "-",
+    "star": "*",
+    "asterisk": "*",
+    "slash": "/",
+    "backslash": "\\",
+    "pipe": "|",
+    "ampersand": "&",
+    "at sign": "@",
+    "hash": "#",
+    "hashtag": "#",
+    "pound": "#",
+    "dollar": "$",
+    "percent": "%",
+    "caret": "^",
+    "tilde": "~",
+    "grave": "`",
+    "backtick": "`",
+
+    # Brackets and parentheses
+    "open paren": "(",
+    "close paren": ")",
+    "left paren": "(",
+    "right paren": ")",
+    "open bracket": "[",
+    "close bracket": "]",
+    "left bracket": "[",
+    "right bracket": "]",
+    "open brace": "{",
+    "close brace": "}",
+    "left brace": "{",
+    "right brace": "}",
+    "open curly": "{",
+    "close curly": "}",
+    "left curly": "{",
+    "right curly": "}",
+
+    # Quotes
+    "single quote": "'",
+    "double quote": '"',
+    "quote": '"',
+    "tick": "'",
+
+    # Comparison operators
+    "less than": "<",
+    "greater than": ">",
+    "less than or equal": "<=",
+    "greater than or equal": ">=",
+    "not equal": "!=",
+    "not equals": "!=",
+    "double equals": "==",
+    "triple equals": "===",
+
+    # Logical operators
+    "and and": "&&",
+    "or or": "||",
+    "not not": "!!",
+
+    # Common punctuation
+    "semicolon": ";",
+    "colon": ":",
+    "comma": ",",
+    "period": ".",
+    "dot": ".",
+    "question mark": "?",
+    "exclamation": "!",
+    "exclamation mark": "!",
+
+    # File extensions (common ones)
+    "dot py": ".py",
+    "dot js": ".js",
+    "dot ts": ".ts",
+    "dot html": ".html",
+    "dot css": ".css",
+    "dot json": ".json",
+    "dot xml": ".xml",
+    "dot txt": ".txt",
+    "dot md": ".md",
+    "dot yml": ".yml",
+    "dot yaml": ".yaml",
+    "dot sql": ".sql",
+    "dot sh": ".sh",
+    "dot bat": ".bat",
+    "dot exe": ".exe",
+    "dot dll": ".dll",
+    "dot jar": ".jar",
+    "dot cpp": ".cpp",
+    "dot c": ".c",
+    "dot h": ".h",
+    "dot java": ".java",
+    "dot php": ".php",
+    "dot rb": ".rb",
+    "dot go": ".go",
+    "dot rs": ".rs",
+    "dot swift": ".swift",
+    "dot kt": ".kt",
+    "dot scala": ".scala",
+    "dot r": ".r",
+    "dot m": ".m",
+    "dot mm": ".mm",
+
+    # Programming keywords and common terms
+    "def": "def",
+    "function": "function",
+    "class": "class",
+    "import": "import",
+    "from": "from",
+    "return": "return",
+    "if": "if",
+    "else": "else",
+    "elif": "elif",
+    "for": "for",
+    "while": "while",
+    "try": "try",
+    "except": "except",
+    "finally": "finally",
+    "with": "with",
+    "as": "as",
+    "true": "true",
+    "false": "false",
+    "null": "null",
+    "none": "None",
+    "undefined": "undefined",
+    "var": "var",
+    "let": "let",
+    "const": "const",
+    "async": "async",
+    "await": "await",
+
+    # Common method names
+    "get": "get",
+    "set": "set",
+    "post": "post",
+    "put": "put",
+    "delete": "delete",
+    "update": "update",
+    "create": "create",
+    "read": "read",
+    "write": "write",
+    "open": "open",
+    "close": "close",
+    "save": "save",
+    "load": "load",
+    "init": "init",
+    "main": "main",
+    "test": "test",
+    "run": "run",
+    "start": "start",
+    "stop": "stop",
+
+    # Common variable patterns
+    "camel case": "camelCase",
+    "snake case": "snake_case",
+    "kebab case": "kebab-case",
+    "pascal case": "PascalCase",
+
+    # Version control
+    "git": "git",
+    "commit": "commit",
+    "push": "push",
+    "pull": "pull",
+    "merge": "merge",
+    "branch": "branch",
+    "checkout": "checkout",
+    "clone": "clone",
+    "status": "status",
+    "log": "log",
+    "diff": "diff",
+    "add": "add",
+    "remove": "remove",
+    "rm": "rm",
+    "mv": "mv",
+    "cp": "cp",
+    "ls": "ls",
+    "cd": "cd",
+    "pwd": "pwd",
+    "mkdir": "mkdir",
+    "rmdir": "rmdir",
+    "chmod": "chmod",
+    "chown": "chown",
+    "grep": "grep",
+    "find": "find",
+    "sed": "sed",
+    "awk": "awk",
+    "sort": "sort",
+    "uniq": "uniq",
+    "head": "head",
+    "tail": "tail",
+    "cat": "cat",
+    "less": "less",
+    "more": "more",
+    "nano": "nano",
+    "vim": "vim",
+    "emacs": "emacs",
+})
+
+
+# Spoken number word values (composed by _normalize_numbers)
+_NUMBER_WORDS = MappingProxyType({
+    "zero": 0,
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+    "ten": 10,
+    "eleven": 11,
+    "twelve": 12,
+    "thirteen": 13,
+    "fourteen": 14,
+    "fifteen": 15,
+    "sixteen": 16,
+    "seventeen": 17,
+    "eighteen": 18,
+    "nineteen": 19,
+    "twenty": 20,
+    "thirty": 30,
+    "forty": 40,
+    "fifty": 50,
+    "sixty": 60,
+    "seventy": 70,
+    "eighty": 80,
+    "ninety": 90,
+    "hundred": 100,
+    "thousand": 1000,
+})
+
+
+# Case-sensitive normalization rules (applied after case-insensitive)
+_CASE_SENSITIVE_RULES = MappingProxyType({
+    # SQL keywords (uppercase)
+    "select": "SELECT",
+    "from": "FROM",
+    "where": "WHERE",
+    "order by": "ORDER BY",
+    "group by": "GROUP BY",
+    "having": "HAVING",
+    "insert": "INSERT",
+    "update": "UPDATE",
+    "delete": "DELETE",
+    "create": "CREATE",
+    "drop": "DROP",
+    "alter": "ALTER",
+    "table": "TABLE",
+    "database": "DATABASE",
+    "index": "INDEX",
+    "view": "VIEW",
+    "procedure": "PROCEDURE",
+    "function": "FUNCTION",
+
+    # Common constants
+    "true": "True",  # Python
+    "false": "False",  # Python
+    "null": "None",  # Python
+    "this": "this",
+    "self": "self",
+    "super": "super",
+    "static": "static",
+    "final": "final",
+    "abstract": "abstract",
+    "public": "public",
+    "private": "private",
+    "protected": "protected",
+    "virtual": "virtual",
+    "override": "override",
+    "interface": "interface",
+    "enum": "enum",
+    "struct": "struct",
+    "union": "union",
+    "typedef": "typedef",
+    "namespace": "namespace",
+    "using": "using",
+    "template": "template",
+    "typename": "typename",
+    "operator": "operator",
+    "sizeof": "sizeof",
+    "typeof": "typeof",
+    "instanceof": "instanceof",
+    "new": "new",
+    "delete": "delete",
+    "malloc": "malloc",
+    "free": "free",
+    "printf": "printf",
+    "scanf": "scanf",
+    "cout": "cout",
+    "cin": "cin",
+    "endl": "endl",
+    "std": "std",
+    "iostream": "iostream",
+    "vector": "vector",
+    "string": "string",
+    "array": "array",
+    "list": "list",
+    "dict": "dict",
+    "set": "set",
+    "tuple": "tuple",
+    "map": "map",
+    "pair": "pair",
+    "queue": "queue",
+    "stack": "stack",
+    "deque": "deque",
+    "priority_queue": "priority_queue",
+    "unordered_map": "unordered_map",
+    "unordered_set": "unordered_set",
+})
+
+
+def _trie_source(phrases: Iterable[str]) -> str:
+    """Regex source for a prefix tree of the phrases: a shared prefix is
+    matched once instead of per phrase (a regex-only stand-in for
+    Aho-Corasick), and a longer continuation is always tried before
+    stopping, so e.g. "greater than or equal" wins over "greater than"."""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[''] = None  # A phrase ends here
+    
+    def build(node) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in node.items() if ch]
+        if not branches:
+            return ''
+        alt = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + alt + ')?' if '' in node else alt
+    
+    return build(trie)
+
+
+def _compose_numbers(values: List[int]) -> List[int]:
+    """Fold a run of spoken number values into numbers: [20, 5] -> [25],
+    [2, 1000, 20, 4] -> [2024]. A word that can't continue the current
+    number starts a new one, so digit strings stay apart: [1, 2] -> [1, 2]"""
+    numbers = []
+    total = current = 0  # Completed thousands / the part below them
+    last = None          # Previous value folded into the current number
+    for value in values:
+        if last is not None:
+            if value == 1000:
+                joins = 0 < last != 1000 and total == 0  # Never scale a zero
+            elif value == 100:
+                joins = 0 < last < 100 and current < 100
+            elif value >= 10:
+                joins = last >= 100
+            else:
+                joins = value > 0 and (last >= 100 or (20 <= last and last % 10 == 0))
+            if not joins:
+                numbers.append(total + current)
+                total = current = 0
+                last = None
+        
+        if value == 1000:
+            total = (current or 1) * 1000
+            current = 0
+        elif value == 100:
+            current = (current or 1) * 100
+        else:
+            current += value
+        last = value
+    numbers.append(total + current)
+    return numbers
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_cached(normalizer: 'TextNormalizer', rules_version: int, text: str) -> str:
+    """Memoized normalization; short utterances ("save", "git status") repeat
+    a lot. rules_version changes whenever the normalizer's rules do."""
+    return normalizer._normalize(text)
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_phrases(phrases: Tuple[str, ...], flags: int = 0) -> Optional[Pattern]:
+    """Fuse phrases into one word-bounded pattern (None if empty); cached so
+    instances with the same rules share the compiled pattern"""
+    source = _trie_source(phrases)
+    if not source:
+        return None
+    return re.compile(r'\b(?:' + source + r')\b', flags)
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_rule_pattern(ci_phrases: Tuple[str, ...], cs_phrases: Tuple[str, ...]) -> Optional[Pattern]:
+    """One pattern for both rule tables: the 'ci' group matches
+    case-insensitive phrases and is tried first, the 'cs' group matches
+    case-sensitive ones (None if both are empty)"""
+    branches = []
+    if ci_phrases:
+        branches.append('(?i:(?P<ci>' + _trie_source(ci_phrases) + '))')
+    if cs_phrases:
+        branches.append('(?P<cs>' + _trie_source(cs_phrases) + ')')
+    if not branches:
+        return None
+    return re.compile(r'\b(?:' + '|'.join(branches) + r')\b')
+
+
+@functools.lru_cache(maxsize=None)
+def _number_run_pattern() -> Pattern:
+    """Pattern for a run of adjacent number words"""
+    word = _trie_source(_NUMBER_WORDS)
+    return re.compile(r'\b(?:' + word + r')\b(?:\s+(?:' + word + r')\b)*', re.IGNORECASE)
 
 
 class TextNormalizer:
@@ -12,352 +440,65 @@ class TextNormalizer:
     
     def __init__(self):
         self.enabled = True
-        self.normalization_rules = self._build_normalization_rules()
-        self.case_sensitive_rules = self._build_case_sensitive_rules()
+        self.normalization_rules = _NORMALIZATION_RULES
+        self.case_sensitive_rules = _CASE_SENSITIVE_RULES
+        self.number_words = _NUMBER_WORDS
+        self._number_pattern = _number_run_pattern()
+        self._version = 0
+        self._compile_rules()
+        
+    def _compile_rules(self):
+        """(Re)build the fused patterns; call after any rule table change"""
+        self._version += 1  # Invalidates cached results for the old rules
+        self._drop_invalid_rules(self.normalization_rules)
+        self._drop_invalid_rules(self.case_sensitive_rules)
+        ci_rules = self.normalization_rules
+        cs_rules = self.case_sensitive_rules
+        # Both tables run in one pass. The case-sensitive rules used to run
+        # on the case-insensitive output, so fold them into those
+        # replacements ("true" -> "true" -> "True") and leave out phrases a
+        # case-insensitive rule already covers. Identity entries ("this" ->
+        # "this") are no-ops when matched case-sensitively; leave them out
+        # too. (Case-insensitive identities stay: they fold "Return" to
+        # "return".)
+        self._ci_replacements = {k: cs_rules.get(v, v) for k, v in ci_rules.items()}
+        cs_phrases = tuple(k for k, v in cs_rules.items()
+                           if k != v and k.lower() not in ci_rules)
+        self._rule_pattern = _compile_rule_pattern(tuple(ci_rules), cs_phrases)
+        # Any phrase of any pass, case-insensitively; text without a hit
+        # skips straight to post-processing
+        self._trigger_pattern = _compile_phrases(
+            tuple(chain(self.number_words, self.normalization_rules, cs_phrases)), re.IGNORECASE)
+        
+    @staticmethod
+    def _drop_invalid_rules(rules: Dict[str, str]):
+        """Remove rules that would break the fused pattern: an empty phrase
+        matches at every word boundary, and a non-string replacement makes
+        every substitution fail"""
+        bad = [phrase for phrase, replacement in rules.items()
+               if not isinstance(phrase, str) or not phrase.strip()
+               or not isinstance(replacement, str)]
+        for phrase in bad:
+            log.warning("Dropping invalid normalization rule %r -> %r", phrase, rules.pop(phrase))
         
-    def _build_normalization_rules(self) -> Dict[str, str]:
-        """Build case-insensitive normalization rules"""
-        return {
-            # Basic symbols
-            "underscore": "_",
-            "under score": "_",
-            "dash": "-",
-            "hyphen": "-",
-            "equals": "=",
-            "equal": "=",
-            "plus": "+",
-            "minus": "-",
-            "star": "*",
-            "asterisk": "*",
-            "slash": "/",
-            "backslash": "\\\\",
-            "pipe": "|",
-            "ampersand": "&",
-            "at sign": "@",
-            "hash": "#",
-            "hashtag": "#",
-            "pound": "#",
-            "dollar": "$",
-            "percent": "%",
-            "caret": "^",
-            "tilde": "~",
-            "grave": "`",
-            "backtick": "`",
-            
-            # Brackets and parentheses
-            "open paren": "(",
-            "close paren": ")",
-            "left paren": "(",
-            "right paren": ")",
-            "open bracket": "[",
-            "close bracket": "]",
-            "left bracket": "[",
-            "right bracket": "]",
-            "open brace": "{",
-            "close brace": "}",
-            "left brace": "{",
-            "right brace": "}",
-            "open curly": "{",
-            "close curly": "}",
-            "left curly": "{",
-            "right curly": "}",
-            
-            # Quotes
-            "single quote": "'",
-            "double quote": '"',
-            "quote": '"',
-            "tick": "'",
-            
-            # Comparison operators
-            "less than": "<",
-            "greater than": ">",
-            "less than or equal": "<=",
-            "greater than or equal": ">=",
-            "not equal": "!=",
-            "not equals": "!=",
-            "double equals": "==",
-            "triple equals": "===",
-            
-            # Logical operators
-            "and and": "&&",
-            "or or": "||",
-            "not not": "!!",
-            
-            # Common punctuation
-            "semicolon": ";",
-            "colon": ":",
-            "comma": ",",
-            "period": ".",
-            "dot": ".",
-            "question mark": "?",
-            "exclamation": "!",
-            "exclamation mark": "!",
-            
-            # Numbers (spoken words to digits)
-            "zero": "0",
-            "one": "1",
-            "two": "2",
-            "three": "3",
-            "four": "4",
-            "five": "5",
-            "six": "6",
-            "seven": "7",
-            "eight": "8",
-            "nine": "9",
-            "ten": "10",
-            "eleven": "11",
-            "twelve": "12",
-            "thirteen": "13",
-            "fourteen": "14",
-            "fifteen": "15",
-            "sixteen": "16",
-            "seventeen": "17",
-            "eighteen": "18",
-            "nineteen": "19",
-            "twenty": "20",
-            "thirty": "30",
-            "forty": "40",
-            "fifty": "50",
-            "sixty": "60",
-            "seventy": "70",
-            "eighty": "80",
-            "ninety": "90",
-            "hundred": "100",
-            "thousand": "1000",
-            
-            # File extensions (common ones)
-            "dot py": ".py",
-            "dot js": ".js",
-            "dot ts": ".ts",
-            "dot html": ".html",
-            "dot css": ".css",
-            "dot json": ".json",
-            "dot xml": ".xml",
-            "dot txt": ".txt",
-            "dot md": ".md",
-            "dot yml": ".yml",
-            "dot yaml": ".yaml",
-            "dot sql": ".sql",
-            "dot sh": ".sh",
-            "dot bat": ".bat",
-            "dot exe": ".exe",
-            "dot dll": ".dll",
-            "dot jar": ".jar",
-            "dot cpp": ".cpp",
-            "dot c": ".c",
-            "dot h": ".h",
-            "dot java": ".java",
-            "dot php": ".php",
-            "dot rb": ".rb",
-            "dot go": ".go",
-            "dot rs": ".rs",
-            "dot swift": ".swift",
-            "dot kt": ".kt",
-            "dot scala": ".scala",
-            "dot r": ".r",
-            "dot m": ".m",
-            "dot mm": ".mm",
-            
-            # Programming keywords and common terms
-            "def": "def",
-            "function": "function",
-            "class": "class",
-            "import": "import",
-            "from": "from",
-            "return": "return",
-            "if": "if",
-            "else": "else",
-            "elif": "elif",
-            "for": "for",
-            "while": "while",
-            "try": "try",
-            "except": "except",
-            "finally": "finally",
-            "with": "with",
-            "as": "as",
-            "true": "true",
-            "false": "false",
-            "null": "null",
-            "none": "None",
-            "undefined": "undefined",
-            "var": "var",
-            "let": "let",
-            "const": "const",
-            "async": "async",
-            "await": "await",
-            
-            # Common method names
-            "get": "get",
-            "set": "set",
-            "post": "post",
-            "put": "put",
-            "delete": "delete",
-            "update": "update",
-            "create": "create",
-            "read": "read",
-            "write": "write",
-            "open": "open",
-            "close": "close",
-            "save": "save",
-            "load": "load",
-            "init": "init",
-            "main": "main",
-            "test": "test",
-            "run": "run",
-            "start": "start",
-            "stop": "stop",
-            
-            # Common variable patterns
-            "camel case": "camelCase",
-            "snake case": "snake_case",
-            "kebab case": "kebab-case",
-            "pascal case": "PascalCase",
-            
-            # Version control
-            "git": "git",
-            "commit": "commit",
-            "push": "push",
-            "pull": "pull",
-            "merge": "merge",
-            "branch": "branch",
-            "checkout": "checkout",
-            "clone": "clone",
-            "status": "status",
-            "log": "log",
-            "diff": "diff",
-            "add": "add",
-            "remove": "remove",
-            "rm": "rm",
-            "mv": "mv",
-            "cp": "cp",
-            "ls": "ls",
-            "cd": "cd",
-            "pwd": "pwd",
-            "mkdir": "mkdir",
-            "rmdir": "rmdir",
-            "chmod": "chmod",
-            "chown": "chown",
-            "grep": "grep",
-            "find": "find",
-            "sed": "sed",
-            "awk": "awk",
-            "sort": "sort",
-            "uniq": "uniq",
-            "head": "head",
-            "tail": "tail",
-            "cat": "cat",
-            "less": "less",
-            "more": "more",
-            "nano": "nano",
-            "vim": "vim",
-            "emacs": "emacs",
-        }
-    
-    def _build_case_sensitive_rules(self) -> Dict[str, str]:
-        """Build case-sensitive normalization rules (applied after case-insensitive)"""
-        return {
-            # SQL keywords (uppercase)
-            "select": "SELECT",
-            "from": "FROM",
-            "where": "WHERE",
-            "order by": "ORDER BY",
-            "group by": "GROUP BY",
-            "having": "HAVING",
-            "insert": "INSERT",
-            "update": "UPDATE",
-            "delete": "DELETE",
-            "create": "CREATE",
-            "drop": "DROP",
-            "alter": "ALTER",
-            "table": "TABLE",
-            "database": "DATABASE",
-            "index": "INDEX",
-            "view": "VIEW",
-            "procedure": "PROCEDURE",
-            "function": "FUNCTION",
-            
-            # Common constants
-            "true": "True",  # Python
-            "false": "False",  # Python
-            "null": "None",  # Python
-            "this": "this",
-            "self": "self",
-            "super": "super",
-            "static": "static",
-            "final": "final",
-            "abstract": "abstract",
-            "public": "public",
-            "private": "private",
-            "protected": "protected",
-            "virtual": "virtual",
-            "override": "override",
-            "interface": "interface",
-            "enum": "enum",
-            "struct": "struct",
-            "union": "union",
-            "typedef": "typedef",
-            "namespace": "namespace",
-            "using": "using",
-            "template": "template",
-            "typename": "typename",
-            "operator": "operator",
-            "sizeof": "sizeof",
-            "typeof": "typeof",
-            "instanceof": "instanceof",
-            "new": "new",
-            "delete": "delete",
-            "malloc": "malloc",
-            "free": "free",
-            "printf": "printf",
-            "scanf": "scanf",
-            "cout": "cout",
-            "cin": "cin",
-            "endl": "endl",
-            "std": "std",
-            "iostream": "iostream",
-            "vector": "vector",
-            "string": "string",
-            "array": "array",
-            "list": "list",
-            "dict": "dict",
-            "set": "set",
-            "tuple": "tuple",
-            "map": "map",
-            "pair": "pair",
-            "queue": "queue",
-            "stack": "stack",
-            "deque": "deque",
-            "priority_queue": "priority_queue",
-            "unordered_map": "unordered_map",
-            "unordered_set": "unordered_set",
-        }
-    
     def normalize_text(self, text: str) -> str:
         """Apply all normalization rules to the text"""
         if not self.enabled or not text:
             return text
-            
+        return _normalize_cached(self, self._version, text)
+    
+    def _normalize(self, text: str) -> str:
+        """Run the normalization pipeline (uncached)"""
         normalized = text
         
         try:
-            # Apply case-insensitive rules first
-            for phrase, replacement in self.normalization_rules.items():
-                try:
-                    # Use word boundaries to avoid partial matches
-                    pattern = r'\b' + re.escape(phrase) + r'\b'
-                    normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
-                except Exception as e:
-                    print(f"Error processing phrase '{phrase}': {e}")
-                    continue
-            
-            # Apply case-sensitive rules
-            for phrase, replacement in self.case_sensitive_rules.items():
-                try:
-                    pattern = r'\b' + re.escape(phrase) + r'\b'
-                    normalized = re.sub(pattern, replacement, normalized)
-                except Exception as e:
-                    print(f"Error processing case-sensitive phrase '{phrase}': {e}")
-                    continue
+            if self._trigger_pattern.search(normalized):
+                # Spoken numbers to digits ("twenty five" -> "25")
+                normalized = self._normalize_numbers(normalized)
+                
+                # Apply both rule tables (one scan for all phrases)
+                if self._rule_pattern is not None:
+                    normalized = self._rule_pattern.sub(self._replace_rule, normalized)
             
             # Apply post-processing rules
             normalized = self._apply_post_processing(normalized)
@@ -365,41 +506,66 @@ class TextNormalizer:
             return normalized
             
         except Exception as e:
-            print(f"Text normalization error: {e}")
+            log.warning("Text normalization error: %s", e)
             return text
     
+    def _replace_rule(self, match) -> str:
+        """Replacement for one match of the fused rule pattern"""
+        if match.lastgroup == 'ci':
+            return self._ci_replacements[match.group().lower()]
+        return self.case_sensitive_rules[match.group()]
+    
+    def _normalize_numbers(self, text: str) -> str:
+        """Replace each run of number words with the number(s) it spells"""
+        values = self.number_words
+        
+        def compose(match) -> str:
+            numbers = _compose_numbers([values[w.lower()] for w in match.group().split()])
+            return ' '.join(map(str, numbers))
+        
+        return self._number_pattern.sub(compose, text)
+    
     def _apply_post_processing(self, text: str) -> str:
         """Apply minimal post-processing - NO automatic spacing"""
         
         try:
             # ONLY fix file extensions (remove spaces around dots)
-            text = re.sub(r'\s*\.\s*([a-zA-Z]{1,4})\b', r'.\1', text)
+            text = _RE_EXT.sub(r'.\1', text)
             
             # Join consecutive single digits (e.g., "1 2 3" -> "123")
-            text = re.sub(r'\b(\d)\s+(?=\d\b)', r'\1', text)
+            text = _RE_DIGIT_RUN.sub(lambda m: ''.join(m.group().split()), text)
             
             # Remove any extra spaces but keep single spaces between words
-            text = re.sub(r'\s{2,}', r' ', text)
-            
-            return text.strip()
+            # (a lone newline or tab is kept)
+            return _RE_WS.sub(' ', text).strip()
             
         except Exception as e:
-            print(f"Post-processing error: {e}")
+            log.warning("Post-processing error: %s", e)
             return text.strip()
     
     def add_custom_rule(self, phrase: str, replacement: str, case_sensitive: bool = False):
         """Add a custom normalization rule"""
         if case_sensitive:
-            self.case_sensitive_rules[phrase] = replacement
+            self._own_rules('case_sensitive_rules')[phrase] = replacement
         else:
-            self.normalization_rules[phrase.lower()] = replacement
+            self._own_rules('normalization_rules')[phrase.lower()] = replacement
+        self._compile_rules()
     
     def remove_custom_rule(self, phrase: str, case_sensitive: bool = False):
         """Remove a custom normalization rule"""
         if case_sensitive:
-            self.case_sensitive_rules.pop(phrase, None)
+            self._own_rules('case_sensitive_rules').pop(phrase, None)
         else:
-            self.normalization_rules.pop(phrase.lower(), None)
+            self._own_rules('normalization_rules').pop(phrase.lower(), None)
+        self._compile_rules()
+    
+    def _own_rules(self, attr: str) -> Dict[str, str]:
+        """Rule table to modify, copied from the shared built-in one on first write"""
+        rules = getattr(self, attr)
+        if isinstance(rules, MappingProxyType):
+            rules = dict(rules)
+            setattr(self, attr, rules)
+        return rules
     
     def enable(self):
         """Enable text normalization"""
@@ -424,16 +590,18 @@ class TextNormalizer:
         
         changes = []
         if original != normalized:
-            # Find specific changes (simplified)
+            import difflib  # Preview-only; keeps module import light
+            
+            # Word-level diff, including replacements that change word count
             words_before = original.split()
             words_after = normalized.split()
             
-            if len(words_before) == len(words_after):
-                for i, (before, after) in enumerate(zip(words_before, words_after)):
-                    if before != after:
-                        changes.append(f"'{before}' → '{after}'")
-            else:
-                changes.append("Structure changed")
+            matcher = difflib.SequenceMatcher(None, words_before, words_after, autojunk=False)
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+                if tag != 'equal':
+                    before = ' '.join(words_before[i1:i2])
+                    after = ' '.join(words_after[j1:j2])
+                    changes.append(f"'{before}' → '{after}'")
         
         return {
             "original": original,
@@ -443,20 +611,36 @@ class TextNormalizer:
         }
 
 
-# Global instance for easy access
-text_normalizer = TextNormalizer()
+# Global instance for easy access, created on first use so importing this
+# module compiles nothing
+_instance = None
+
+
+def get_text_normalizer() -> TextNormalizer:
+    """Get the global TextNormalizer (created on first call)"""
+    global _instance
+    if _instance is None:
+        _instance = TextNormalizer()
+    return _instance
+
+
+def __getattr__(name):
+    """Keep `from text_normalizer import text_normalizer` working"""
+    if name == 'text_normalizer':
+        return get_text_normalizer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def normalize_text(text: str) -> str:
     """Convenience function for text normalization"""
-    return text_normalizer.normalize_text(text)
+    return get_text_normalizer().normalize_text(text)
 
 
 def add_normalization_rule(phrase: str, replacement: str, case_sensitive: bool = False):
     """Convenience function to add a custom rule"""
-    text_normalizer.add_custom_rule(phrase, replacement, case_sensitive)
+    get_text_normalizer().add_custom_rule(phrase, replacement, case_sensitive)
 
 
 def preview_normalization(text: str) -> Dict[str, str]:
     """Convenience function to preview normalization changes"""
-    return text_normalizer.preview_normalization(text) 
\ No newline at end of file
+    return get_text_normalizer().preview_normalization(text)
@@ -3,14 +3,61 @@
 # Purpose: Minimal, responsive UI for voice-to-text
 # Dependencies: tkinter
 
+import logging
 import tkinter as tk
+from contextlib import contextmanager
 from tkinter import ttk
+from tkinter import font as tkfont
 from typing import Optional, Callable
 
+log = logging.getLogger('v3ptt.ui_manager')
+
+# Shared palette
+_BG_DARK = '#1a1a1a'
+_BG_PANEL = '#2d2d2d'
+
+# Named fonts shared by every widget; Tk parses each spec once instead of
+# per widget. Created by _init_fonts once a Tk root exists.
+_FONT_TK = None
+_FONT_UI = _FONT_UI_BOLD = _FONT_SMALL = _FONT_TINY = None
+_FONT_ICON = _FONT_MONO_BOLD = None
+
+
+def _init_fonts(widget):
+    """Create the shared fonts for this widget's Tk interpreter (once)"""
+    global _FONT_TK, _FONT_UI, _FONT_UI_BOLD, _FONT_SMALL, _FONT_TINY
+    global _FONT_ICON, _FONT_MONO_BOLD
+    if _FONT_TK is widget.tk:
+        return
+    _FONT_UI = tkfont.Font(widget, family='Arial', size=9)
+    _FONT_UI_BOLD = tkfont.Font(widget, family='Arial', size=9, weight='bold')
+    _FONT_SMALL = tkfont.Font(widget, family='Arial', size=8)
+    _FONT_TINY = tkfont.Font(widget, family='Arial', size=7)
+    _FONT_ICON = tkfont.Font(widget, family='Arial', size=32, weight='bold')
+    _FONT_MONO_BOLD = tkfont.Font(widget, family='Courier', size=8, weight='bold')
+    _FONT_TK = widget.tk
+
+# Audio level updates arriving within this window (ms) are drawn once
+_LEVEL_FLUSH_MS = 40
+
+# Transcript widget keeps at most this many lines (oldest dropped first)
+_TRANSCRIPT_MAX_LINES = 64
+
 
 class UIManager:
     """Manages the main UI window and user interactions"""
     
+    # Status text colors: first token found (case-insensitive) wins
+    _STATUS_COLORS = (
+        ('recording', '#ff6600'),
+        ('listening', '#ff6600'),
+        ('processing', '#ffff00'),
+        ('ready', '#00ff00'),
+        ('loaded', '#00ff00'),
+        ('error', '#ff0000'),
+    )
+    _STATUS_DEFAULT_COLOR = '#cccccc'
+    
     def __init__(self, 
                  on_start_recording: Optional[Callable] = None,
                  on_stop_recording: Optional[Callable] = None,
@@ -25,15 +72,31 @@ class UIManager:
         self.is_recording = False
         self.drag_start_x = 0
         self.drag_start_y = 0
+        self._drag_target = None    # Latest drag position, applied on idle
+        self._drag_pending = False
         self.is_minimized = False
-        self.normal_geometry = None
+        self._normal_rect = None  # (w, h, x, y) of the expanded window
         self.normal_widgets = []
         
         # UI variables
-        self.status_var = tk.StringVar(value="Ready")
+        # Status labels are set directly (no textvariable trace); these hold
+        # the text currently shown
+        self._status_text = "Ready"
+        self._model_status_text = "⚠️ Checking models..."
         self.hotkey_var = tk.StringVar(value="Space")
+        self.mic_mute_var = tk.BooleanVar(value=False)
         self.mic_mute_callback = None
         
+        # Coalesced audio level: newest value wins, drawn by _flush_level
+        self._pending_level = 0.0
+        self._level_pending = False
+        self._last_level = -1.0
+        self._level_bar_w = 0  # Tracked via <Configure>; no per-draw layout pass
+        self._last_level_width = -1
+        self._last_level_color = '#333333'  # level_indicator's initial bg
+        self._last_status_fg = '#00ff00'  # status_label's initial fg
+        self._last_transcript = ""
+        
         self._setup_window()
         self._create_widgets()
     
@@ -44,12 +107,16 @@ class UIManager:
         # Keep minsize small so minimize-to-icon can shrink the window;
         # restore code sets a larger geometry explicitly.
         self.root.minsize(1, 1)
-        self.root.configure(bg='#1a1a1a')
+        self.root.configure(bg=_BG_DARK)
+        
+        # Screen size is queried once and reused for any recentering
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
         
         # Calculate center position immediately
         width, height = 720, 640
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
         
         # Set geometry with position in one call - prevents wrong positioning
         self.root.geometry(f"{width}x{height}+{x}+{y}")
@@ -65,19 +132,34 @@ class UIManager:
         self.root.update_idletasks()
         width = self.root.winfo_width()
         height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
+        x = (self._screen_w // 2) - (width // 2)
+        y = (self._screen_h // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
     
     def _create_widgets(self):
         """Create all UI widgets"""
+        _init_fonts(self.root)
         # Main frame
-        self.main_frame = tk.Frame(self.root, bg='#1a1a1a', relief='raised', bd=1)
+        self.main_frame = tk.Frame(self.root, bg=_BG_DARK, relief='raised', bd=1)
         self.main_frame.pack(fill='both', expand=True, padx=2, pady=2)
-        
-        # Create sections
+        # Sections are gridded one per row; the transcript row takes any
+        # extra height
+        self.main_frame.grid_columnconfigure(0, weight=1)
+        self.main_frame.grid_rowconfigure(3, weight=1)
+        
+        # Create sections: header and status now, the rest on the first
+        # idle pass so the window shows sooner (or earlier, if an update
+        # needs those widgets first)
         self._create_header(self.main_frame)
         self._create_status_section(self.main_frame)
+        self._deferred_built = False
+        self.root.after_idle(self._create_deferred_sections)
+    
+    def _create_deferred_sections(self):
+        """Create the control, transcript and settings sections (once)"""
+        if self._deferred_built:
+            return
+        self._deferred_built = True
         self._create_control_section(self.main_frame)
         self._create_transcript_section(self.main_frame)
         self._create_settings_section(self.main_frame)
@@ -85,18 +167,18 @@ class UIManager:
 
     def _create_header(self, parent):
         """Create header with title and window controls"""
-        self.header_frame = tk.Frame(parent, bg='#2d2d2d', height=30)
-        self.header_frame.pack(fill='x', padx=2, pady=2)
+        self.header_frame = tk.Frame(parent, bg=_BG_PANEL, height=30)
+        self.header_frame.grid(row=0, column=0, sticky='ew', padx=2, pady=2)
         self.header_frame.pack_propagate(False)
         
         # Title
         self.title_label = tk.Label(self.header_frame, text="🎤 v3 PTT", 
-                              fg='white', bg='#2d2d2d', 
-                              font=('Arial', 9, 'bold'))
+                              fg='white', bg=_BG_PANEL, 
+                              font=_FONT_UI_BOLD)
         self.title_label.pack(side='left', padx=5, pady=5)
         
         # Window controls
-        self.controls_frame = tk.Frame(self.header_frame, bg='#2d2d2d')
+        self.controls_frame = tk.Frame(self.header_frame, bg=_BG_PANEL)
         self.controls_frame.pack(side='right', padx=5)
         
         # Collapse-to-dot button (brighter so it stands out next to the
@@ -104,43 +186,76 @@ class UIManager:
         self.minimize_btn = tk.Button(self.controls_frame, text="◉ Small",
                                fg='black', bg='#00ff00',
                                command=self._minimize_window,
-                               relief='raised', font=('Arial', 9, 'bold'))
+                               relief='raised', bd=2, font=_FONT_UI_BOLD)
         self.minimize_btn.pack(side='left', padx=1)
         # Native WM already provides a close button; no custom close button.
+        
+        # Collapsed-mode icon: built once, packed only while minimized
+        # A frame container for the icon (better event handling)
+        self.icon_frame = tk.Frame(self.header_frame, bg=_BG_PANEL, cursor='hand2')
+        # The icon label inside the frame
+        # Use simple text that works on all Windows systems
+        self.icon_button = tk.Label(
+            self.icon_frame,
+            text="●",
+            font=_FONT_ICON,
+            bg=_BG_PANEL,
+            fg='#00ff00',
+            cursor='hand2'
+        )
+        self.icon_button.pack(fill='both', expand=True)
+        # Single, double and right click on the icon all restore
+        for widget in (self.icon_frame, self.icon_button):
+            widget.bind('<Button-1>', self._on_icon_restore)
+            widget.bind('<Double-Button-1>', self._on_icon_restore)
+            widget.bind('<Button-3>', self._on_icon_restore)
+        
+        # Bound once; the handlers only act while collapsed. Drag goes
+        # through a bind tag so the header keeps its own class bindings.
+        self.header_frame.bindtags(('Draggable',) + self.header_frame.bindtags())
+        self.root.bind_class('Draggable', '<Button-1>', self._start_drag)
+        self.root.bind_class('Draggable', '<B1-Motion>', self._drag_window)
+        # Double-click / right-click anywhere on the collapsed window, or
+        # Escape, also restore (Linux WMs may not deliver double-clicks
+        # reliably on small windows)
+        for widget in (self.header_frame, self.root):
+            widget.bind('<Double-Button-1>', self._on_icon_restore)
+            widget.bind('<Button-3>', self._on_icon_restore)
+        self.root.bind('<Escape>', self._on_icon_restore)
     
     def _create_status_section(self, parent):
         """Create status display section"""
-        self.status_frame = tk.Frame(parent, bg='#2d2d2d', relief='sunken', bd=1)
-        self.status_frame.pack(fill='x', padx=5, pady=2)
+        self.status_frame = tk.Frame(parent, bg=_BG_PANEL, relief='sunken', bd=1)
+        self.status_frame.grid(row=1, column=0, sticky='ew', padx=5, pady=2)
         
-        self.status_label = tk.Label(self.status_frame, textvariable=self.status_var,
-                                   fg='#00ff00', bg='#2d2d2d', 
-                                   font=('Arial', 9))
+        self.status_label = tk.Label(self.status_frame, text=self._status_text,
+                                   fg='#00ff00', bg=_BG_PANEL, 
+                                   font=_FONT_UI)
         self.status_label.pack(pady=5)
     
     def _create_control_section(self, parent):
         """Create control buttons section"""
-        self.control_frame = tk.Frame(parent, bg='#1a1a1a')
-        self.control_frame.pack(fill='x', padx=5, pady=5)
+        self.control_frame = tk.Frame(parent, bg=_BG_DARK)
+        self.control_frame.grid(row=2, column=0, sticky='ew', padx=5, pady=5)
         
         # Manual control button
         self.talk_button = tk.Button(self.control_frame, text="Hold to Talk",
                                    fg='white', bg='#0066cc', 
-                                   font=('Arial', 9), relief='raised', bd=2)
+                                   font=_FONT_UI, relief='raised', bd=2)
         self.talk_button.pack(fill='x', pady=2)
         self.talk_button.bind('<ButtonPress-1>', self._on_manual_start)
         self.talk_button.bind('<ButtonRelease-1>', self._on_manual_stop)
         
         # Hotkey display
-        self.hotkey_frame = tk.Frame(self.control_frame, bg='#1a1a1a')
+        self.hotkey_frame = tk.Frame(self.control_frame, bg=_BG_DARK)
         self.hotkey_frame.pack(fill='x', pady=2)
         
         tk.Label(self.hotkey_frame, text="Hotkey:", fg='#cccccc', 
-                bg='#1a1a1a', font=('Arial', 8)).pack(side='left')
+                bg=_BG_DARK, font=_FONT_SMALL).pack(side='left')
         
         self.hotkey_label = tk.Label(self.hotkey_frame, textvariable=self.hotkey_var,
-                                   fg='#00ccff', bg='#1a1a1a', 
-                                   font=('Courier', 8, 'bold'))
+                                   fg='#00ccff', bg=_BG_DARK, 
+                                   font=_FONT_MONO_BOLD)
         self.hotkey_label.pack(side='right')
         
 
@@ -149,54 +264,53 @@ class UIManager:
     
     def _create_transcript_section(self, parent):
         """Create transcript display section"""
-        self.transcript_frame = tk.Frame(parent, bg='#2d2d2d', relief='sunken', bd=1)
-        self.transcript_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        self.transcript_frame = tk.Frame(parent, bg=_BG_PANEL, relief='sunken', bd=1)
+        self.transcript_frame.grid(row=3, column=0, sticky='nsew', padx=5, pady=5)
         
         self.transcript_text = tk.Text(self.transcript_frame, height=4, wrap='word',
-                                     fg='white', bg='#2d2d2d', 
-                                     font=('Arial', 8), relief='flat', bd=0)
+                                     fg='white', bg=_BG_PANEL, 
+                                     font=_FONT_SMALL, relief='flat', bd=0)
         self.transcript_text.pack(fill='both', expand=True, padx=3, pady=3)
     
     def _create_settings_section(self, parent):
         """Create settings and info section"""
-        self.settings_frame = tk.Frame(parent, bg='#1a1a1a')
-        self.settings_frame.pack(fill='x', padx=5, pady=2)
+        self.settings_frame = tk.Frame(parent, bg=_BG_DARK)
+        self.settings_frame.grid(row=4, column=0, sticky='ew', padx=5, pady=2)
         
         # Model status and mic mute row
-        self.status_row_frame = tk.Frame(self.settings_frame, bg='#1a1a1a')
+        self.status_row_frame = tk.Frame(self.settings_frame, bg=_BG_DARK)
         self.status_row_frame.pack(fill='x', pady=1)
         
         # Model status display
-        self.model_status_var = tk.StringVar(value="⚠️ Checking models...")
         self.model_status_label = tk.Label(self.status_row_frame, 
-                                          textvariable=self.model_status_var,
-                                          fg='#ffcc00', bg='#1a1a1a', 
-                                          font=('Arial', 7))
+                                          text=self._model_status_text,
+                                          fg='#ffcc00', bg=_BG_DARK, 
+                                          font=_FONT_TINY)
         self.model_status_label.pack(side='left')
         
         # Mic mute checkbox
-        self.mic_mute_var = tk.BooleanVar(value=False)
         self.mic_mute_checkbox = tk.Checkbutton(self.status_row_frame, 
                                               text="Mic Mute", 
                                               variable=self.mic_mute_var,
-                                              fg='#cccccc', bg='#1a1a1a',
-                                              font=('Arial', 7),
-                                              selectcolor='#2d2d2d',
+                                              fg='#cccccc', bg=_BG_DARK,
+                                              font=_FONT_TINY,
+                                              selectcolor=_BG_PANEL,
                                               activeforeground='#ffffff',
-                                              activebackground='#1a1a1a',
+                                              activebackground=_BG_DARK,
                                               command=self._toggle_mic_mute)
         self.mic_mute_checkbox.pack(side='right')
         
         # Audio level indicator (compact version)
-        self.audio_level_frame = tk.Frame(self.settings_frame, bg='#1a1a1a')
+        self.audio_level_frame = tk.Frame(self.settings_frame, bg=_BG_DARK)
         self.audio_level_frame.pack(fill='x', pady=1)
         
         tk.Label(self.audio_level_frame, text="Audio Level:", fg='#cccccc', 
-                bg='#1a1a1a', font=('Arial', 7)).pack(side='left')
+                bg=_BG_DARK, font=_FONT_TINY).pack(side='left')
         
-        self.level_bar = tk.Frame(self.audio_level_frame, bg='#2d2d2d', height=8, 
+        self.level_bar = tk.Frame(self.audio_level_frame, bg=_BG_PANEL, height=8, 
                                  relief='sunken', bd=1)
         self.level_bar.pack(side='right', fill='x', expand=True, padx=5)
+        self.level_bar.bind('<Configure>', self._on_level_bar_configure)
         
         self.level_indicator = tk.Frame(self.level_bar, bg='#333333', height=6)
         self.level_indicator.pack(side='left', fill='y')
@@ -204,15 +318,15 @@ class UIManager:
         # Settings button
         self.settings_btn = tk.Button(self.settings_frame, text="Settings",
                                fg='white', bg='#404040', 
-                               font=('Arial', 8),
+                               font=_FONT_SMALL,
                                command=self._on_open_settings)
         self.settings_btn.pack(fill='x', pady=2)
         
         # Instructions
         self.instructions = tk.Label(self.settings_frame, 
                               text="Hold hotkey to speak • Drag icon, double-click to restore",
-                              fg='#888888', bg='#1a1a1a', 
-                              font=('Arial', 7))
+                              fg='#888888', bg=_BG_DARK, 
+                              font=_FONT_TINY)
         self.instructions.pack(pady=2)
     
     def _on_manual_start(self, event):
@@ -236,11 +350,11 @@ class UIManager:
             self.on_mic_mute_toggle(self.mic_mute_var.get())
     
     def set_mic_mute_state(self, muted: bool):
-        """Set the mic mute checkbox state programmatically"""
+        """Set the mic mute checkbox state programmatically (thread-safe)"""
         try:
-            self.mic_mute_var.set(muted)
-        except Exception as e:
-            print(f"Error setting mic mute state: {e}")
+            self.root.after(0, self.mic_mute_var.set, muted)
+        except (RuntimeError, tk.TclError) as e:
+            log.warning("Error setting mic mute state: %s", e)
     
     def _start_recording(self):
         """Start recording UI state"""
@@ -256,8 +370,20 @@ class UIManager:
         if self.on_stop_recording:
             self.on_stop_recording()
     
+    @contextmanager
+    def _batched_layout(self):
+        """Hide the window while widgets are repacked/resized, then resolve
+        the layout in a single pass and show it again"""
+        self.root.withdraw()
+        try:
+            yield
+        finally:
+            self.root.update_idletasks()
+            self.root.deiconify()
+    
     def _minimize_window(self):
         """Minimize window to small icon at current location"""
+        self._create_deferred_sections()  # Minimize/restore repack them
         if self.is_minimized:
             self._restore_window()
         else:
@@ -265,135 +391,94 @@ class UIManager:
     
     def _minimize_to_icon(self):
         """Minimize to small icon"""
-        # Store current geometry and position
-        self.normal_geometry = self.root.geometry()
-
-        # Get current position
+        # Store current size and position (before hiding the window)
         current_x = self.root.winfo_x()
         current_y = self.root.winfo_y()
+        self._normal_rect = (self.root.winfo_width(), self.root.winfo_height(),
+                             current_x, current_y)
 
-        # Hide all widgets except header
-        for widget in self.main_frame.winfo_children():
-            if widget != self.header_frame:
-                widget.pack_forget()
+        # Relayout once, while hidden, instead of after every change
+        with self._batched_layout():
+            # Hide all widgets except header
+            for widget in self.main_frame.winfo_children():
+                if widget != self.header_frame:
+                    widget.grid_remove()  # Keeps its grid options for restore
 
-        # Small icon (roughly 4x a titlebar button so it's easy to grab)
-        icon_size = 72
-        self.root.geometry(f"{icon_size}x{icon_size}+{current_x}+{current_y}")
-        
-        # Hide title
-        self.title_label.pack_forget()
+            # Small icon (roughly 4x a titlebar button so it's easy to grab)
+            icon_size = 72
+            self.root.geometry(f"{icon_size}x{icon_size}+{current_x}+{current_y}")
         
-        # Configure header frame for icon mode
-        self.header_frame.configure(height=icon_size, bg='#2d2d2d')
+            # Hide title
+            self.title_label.pack_forget()
         
-        # Keep drag events enabled for moving the icon
-        self.header_frame.bind('<Button-1>', self._start_drag)
-        self.header_frame.bind('<B1-Motion>', self._drag_window)
+            # Configure header frame for icon mode
+            self.header_frame.configure(height=icon_size, bg=_BG_PANEL)
         
-        # Create a frame container for the icon (better event handling)
-        icon_frame = tk.Frame(self.header_frame, bg='#2d2d2d', cursor='hand2')
-        icon_frame.pack(fill='both', expand=True, padx=1, pady=1)
+            # Show the prebuilt icon (reset any pulse tint from last time)
+            self.icon_button.configure(bg=_BG_PANEL, fg='#00ff00')
+            self.icon_frame.configure(bg=_BG_PANEL)
+            self.icon_frame.pack(fill='both', expand=True, padx=1, pady=1)
         
-        # Create the icon label inside the frame
-        # Use simple text that works on all Windows systems
-        self.icon_button = tk.Label(
-            icon_frame,
-            text="●",
-            font=('Arial', 32, 'bold'),
-            bg='#2d2d2d',
-            fg='#00ff00',
-            cursor='hand2'
-        )
-        self.icon_button.pack(fill='both', expand=True)
-        print(f"Created icon with text: 'MIC'")
-        
-        # Create simple double-click restore functionality
-        def on_double_click(e):
-            print(f"Double-click detected - restoring window")
-            self._restore_window()
-            return "break"
-        
-        # Bind both single-click and double-click to restore (Linux WM
-        # may not deliver double-clicks reliably on overrideredirect windows)
-        clickable_widgets = [icon_frame, self.icon_button, self.header_frame, self.root]
-        for widget in clickable_widgets:
-            widget.bind('<Double-Button-1>', on_double_click)
-            widget.bind('<Button-3>', on_double_click)  # right-click restore
-            print(f"Bound restore handlers to {widget}")
-        # Middle-click on icon also restores
-        self.icon_button.bind('<Button-1>', on_double_click)
-        icon_frame.bind('<Button-1>', on_double_click)
-        
-        # Remove problematic hover effects (they cause errors)
-        # Just keep the simple functionality
-        
-        # Add keyboard shortcut as backup (Escape key)
-        self.root.bind('<Escape>', lambda e: self._restore_window())
-        self.root.focus_set()  # Ensure window can receive key events
+            # Remove problematic hover effects (they cause errors)
+            # Just keep the simple functionality
         
-        # Hide the minimize button temporarily
-        self.minimize_btn.pack_forget()
+            # Hide the minimize button temporarily
+            self.minimize_btn.pack_forget()
         
-        # Remove the box-like border
-        self.root.configure(bg='#2d2d2d')
-        self.main_frame.configure(relief='flat', bd=0)
+            # Remove the box-like border
+            self.root.configure(bg=_BG_PANEL)
+            self.main_frame.configure(relief='flat', bd=0)
         
-        self.is_minimized = True
+            self.is_minimized = True
+        self.root.focus_set()  # Ensure window can receive key events
+    
+    def _on_icon_restore(self, event):
+        """Restore from the collapsed icon (click/Escape handlers)"""
+        if not self.is_minimized:
+            return None  # Normal window: let the event through
+        log.debug("Icon clicked - restoring window")
+        self._restore_window()
+        return "break"
     
     def _restore_window(self):
         """Restore window from minimized state"""
-        print("Restoring window from minimized state...")  # Debug
+        log.debug("Restoring window from minimized state")
         
-        # Restore geometry
-        if self.normal_geometry:
-            self.root.geometry(self.normal_geometry)
-            print(f"Restored geometry: {self.normal_geometry}")  # Debug
+        with self._batched_layout():
+            # Restore geometry
+            if self._normal_rect:
+                self.root.wm_geometry("%dx%d+%d+%d" % self._normal_rect)
+                log.debug("Restored geometry: %s", self._normal_rect)
         
-        # Restore window styling (wipe any pulse tint)
-        self.root.configure(bg='#1a1a1a')
-        self.main_frame.configure(relief='raised', bd=1, bg='#1a1a1a')
-        self.header_frame.configure(height=30, bg='#2d2d2d')
+            # Restore window styling (wipe any pulse tint)
+            self.root.configure(bg=_BG_DARK)
+            self.main_frame.configure(relief='raised', bd=1, bg=_BG_DARK)
+            self.header_frame.configure(height=30, bg=_BG_PANEL)
         
-        # Remove the temporary icon button
-        if hasattr(self, 'icon_button'):
-            self.icon_button.destroy()
-            delattr(self, 'icon_button')
-            print("Removed temporary icon button")  # Debug
+            # Hide the icon (kept for the next minimize)
+            self.icon_frame.pack_forget()
         
-        # Remove escape key binding
-        self.root.unbind('<Escape>')
+            # Restore title
+            self.title_label.pack(side='left', padx=5, pady=5)
         
-        # Restore title
-        self.title_label.pack(side='left', padx=5, pady=5)
+            # Restore controls frame position
+            self.controls_frame.pack(side='right', padx=5)
         
-        # Restore controls frame position
-        self.controls_frame.pack(side='right', padx=5)
+            # Minimize button keeps its styling while hidden; just re-pack it
+            self.minimize_btn.pack(side='left', padx=1)
         
-        # Restore minimize button to its normal "◉ Small" style
-        self.minimize_btn.config(
-            text="◉ Small",
-            command=self._minimize_window,
-            font=('Arial', 9, 'bold'),
-            bg='#00ff00',
-            fg='black',
-            relief='raised',
-            bd=2
-        )
-        self.minimize_btn.pack(side='left', padx=1)
+            # Show all widgets again
+            for widget in (self.status_frame, self.control_frame,
+                           self.transcript_frame, self.settings_frame):
+                widget.grid()
         
-        # Show all widgets again
-        self.status_frame.pack(fill='x', padx=5, pady=2)
-        self.control_frame.pack(fill='x', padx=5, pady=5)
-        self.transcript_frame.pack(fill='both', expand=True, padx=5, pady=5)
-        self.settings_frame.pack(fill='x', padx=5, pady=2)
+            self.is_minimized = False
         
-        self.is_minimized = False
-        print("Window restored successfully!")  # Debug
+        log.debug("Window restored")
     
     def _start_drag(self, event):
         """Start window drag"""
-        if event is None:
+        if event is None or not self.is_minimized:
             return
         try:
             self.drag_start_x = event.x
@@ -405,14 +490,28 @@ class UIManager:
 
     def _drag_window(self, event):
         """Drag window to new position"""
-        if event is None:
+        if event is None or not self.is_minimized:
             return
         try:
             x = self.root.winfo_x() + event.x - self.drag_start_x
             y = self.root.winfo_y() + event.y - self.drag_start_y
-            self.root.geometry(f"+{x}+{y}")
         except (AttributeError, tk.TclError):
             # Handle invalid event or window state
+            return
+        # Motion events arrive faster than the WM can move the window;
+        # move once per idle pass to the latest position
+        self._drag_target = (x, y)
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.root.after_idle(self._flush_drag)
+    
+    def _flush_drag(self):
+        """Move the window to the latest drag position"""
+        self._drag_pending = False
+        x, y = self._drag_target
+        try:
+            self.root.wm_geometry("+%d+%d" % (x, y))
+        except tk.TclError:
             pass
     
     def update_status(self, status: str):
@@ -423,21 +522,22 @@ class UIManager:
             pass  # UI likely torn down
 
     def _update_status_impl(self, status: str):
-        self.status_var.set(status)
+        if status != self._status_text:
+            self._status_text = status
+            self.status_label.config(text=status)
         self._update_status_color(status)
     
     def _update_status_color(self, status: str):
         """Update status color based on content"""
-        if "Recording" in status or "Listening" in status:
-            self.status_label.config(fg='#ff6600')
-        elif "Processing" in status:
-            self.status_label.config(fg='#ffff00')
-        elif "ready" in status.lower() or "loaded" in status.lower():
-            self.status_label.config(fg='#00ff00')
-        elif "error" in status.lower():
-            self.status_label.config(fg='#ff0000')
-        else:
-            self.status_label.config(fg='#cccccc')
+        lowered = status.lower()
+        color = self._STATUS_DEFAULT_COLOR
+        for token, token_color in self._STATUS_COLORS:
+            if token in lowered:
+                color = token_color
+                break
+        if color != self._last_status_fg:
+            self._last_status_fg = color
+            self.status_label.config(fg=color)
     
     def update_transcript(self, text: str):
         """Update transcript display (thread-safe)"""
@@ -447,12 +547,46 @@ class UIManager:
             pass
 
     def _update_transcript_impl(self, text: str):
-        self.transcript_text.delete(1.0, tk.END)
-        self.transcript_text.insert(1.0, text)
+        self._create_deferred_sections()
+        last = self._last_transcript
+        if text == last:
+            return
+        if last and text.startswith(last):
+            # Growing transcript: append only the new tail
+            self.transcript_text.insert(tk.END, text[len(last):])
+            excess = int(self.transcript_text.index('end-1c').split('.')[0]) - _TRANSCRIPT_MAX_LINES
+            if excess > 0:
+                self.transcript_text.delete('1.0', '%d.0' % (excess + 1))
+        else:
+            shown = text
+            if text.count('\n') >= _TRANSCRIPT_MAX_LINES:
+                shown = '\n'.join(text.split('\n')[-_TRANSCRIPT_MAX_LINES:])
+            self.transcript_text.delete(1.0, tk.END)
+            self.transcript_text.insert(1.0, shown)
+        self._last_transcript = text
+    
+    def apply_update(self, update: dict):
+        """Apply several display updates in one idle callback (thread-safe)
+
+        Recognized keys: 'transcript', 'status'.
+        """
+        try:
+            self.root.after_idle(self._apply_update_impl, update)
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _apply_update_impl(self, update: dict):
+        if 'transcript' in update:
+            self._update_transcript_impl(update['transcript'])
+        if 'status' in update:
+            self._update_status_impl(update['status'])
     
     def update_hotkey_display(self, hotkey_text: str):
-        """Update hotkey display"""
-        self.hotkey_var.set(hotkey_text)
+        """Update hotkey display (thread-safe)"""
+        try:
+            self.root.after(0, self.hotkey_var.set, hotkey_text)
+        except (RuntimeError, tk.TclError):
+            pass
     
     def set_always_on_top(self, on_top: bool):
         """Set window always on top"""
@@ -466,43 +600,73 @@ class UIManager:
             pass
 
     def _update_model_status_impl(self, status: str):
-        self.model_status_var.set(status)
+        self._create_deferred_sections()
+        if status == self._model_status_text:
+            return
+        self._model_status_text = status
         if "✅" in status:
-            self.model_status_label.config(fg='#00ff00')
+            fg = '#00ff00'
         elif "❌" in status:
-            self.model_status_label.config(fg='#ff4444')
+            fg = '#ff4444'
         else:
-            self.model_status_label.config(fg='#ffcc00')
+            fg = '#ffcc00'
+        self.model_status_label.config(text=status, fg=fg)
     
     def update_audio_level(self, level: float):
-        """Update audio level indicator (0-100)"""
+        """Update audio level indicator (0-100); bursts are coalesced"""
+        self._pending_level = level
+        if not self._level_pending:
+            self._level_pending = True
+            self.root.after(_LEVEL_FLUSH_MS, self._flush_level)
+    
+    def _flush_level(self):
+        """Draw the newest pending audio level, unless it barely moved"""
+        self._level_pending = False
+        level = self._pending_level
+        if abs(level - self._last_level) < 2:
+            return
+        self._last_level = level
+        self._draw_audio_level(level)
+    
+    def _on_level_bar_configure(self, event):
+        """Remember the level bar width whenever it is laid out"""
+        self._level_bar_w = event.width
+    
+    def _draw_audio_level(self, level: float):
+        """Apply an audio level to the indicator (and the collapsed icon)"""
         try:
-            # Get maximum available width for the level bar
-            self.level_bar.update_idletasks()
-            max_width = self.level_bar.winfo_width()
+            # Maximum available width for the level bar (cached on resize)
+            max_width = self._level_bar_w
             
             if max_width > 0:
                 # Calculate indicator width based on audio level
                 level_width = int((level / 100) * max_width)
                 level_width = max(0, min(level_width, max_width))
                 
-                # Update indicator width
-                self.level_indicator.config(width=level_width)
-                
-                # Update color based on level
+                # Color based on level
                 if level > 30:
-                    self.level_indicator.config(bg='#00ff00')  # Green - good level
+                    color = '#00ff00'  # Green - good level
                 elif level > 10:
-                    self.level_indicator.config(bg='#ffcc00')  # Yellow - low level
+                    color = '#ffcc00'  # Yellow - low level
                 else:
-                    self.level_indicator.config(bg='#333333')  # Dark gray - very low/no signal
+                    color = '#333333'  # Dark gray - very low/no signal
+                
+                # Only send what changed (width within 1px counts as same)
+                changes = {}
+                if abs(level_width - self._last_level_width) >= 2:
+                    changes['width'] = self._last_level_width = level_width
+                if color != self._last_level_color:
+                    changes['bg'] = self._last_level_color = color
+                if changes:
+                    self.level_indicator.config(**changes)
                     
         except (tk.TclError, AttributeError) as e:
             # Handle Tkinter errors during UI updates
-            print(f"UI update error: {e}")
+            log.debug("UI update error: %s", e)
 
         # Pulse the collapsed dot window background with audio level
-        if self.is_minimized and hasattr(self, 'icon_button') and self.icon_button.winfo_exists():
+        # (the icon is built once with the header, so it always exists)
+        if self.is_minimized:
             try:
                 # Map level 0-100 to green brightness for the whole icon area
                 brightness = int(30 + (level / 100.0) * 225)  # 30..255
@@ -512,7 +676,7 @@ class UIManager:
                 # dark when background is bright, light when background is dim.
                 fg_color = '#003300' if brightness > 140 else '#00ff88'
                 self.icon_button.config(bg=bg_color, fg=fg_color)
-                self.icon_button.master.config(bg=bg_color)  # icon_frame
+                self.icon_frame.config(bg=bg_color)
                 self.header_frame.config(bg=bg_color)
                 self.root.config(bg=bg_color)
                 self.main_frame.config(bg=bg_color)
@@ -524,49 +688,14 @@ class UIManager:
         try:
             self.root.mainloop()
         except Exception as e:
-            print(f"UI mainloop error: {e}")
+            log.warning("UI mainloop error: %s", e)
             raise
     
     def destroy(self):
         """Clean up and close window"""
-        print("Cleaning up UI...")
+        # Destroying the root drops its bindings and pending after() calls
+        log.debug("Cleaning up UI")
         try:
-            # Cancel any pending after() calls
-            if hasattr(self, 'root') and self.root:
-                try:
-                    # Cancel all pending after() calls
-                    # Note: after_cancel('all') doesn't exist in standard Tkinter
-                    # We'll just destroy the window which cancels pending calls
-                    pass
-                except tk.TclError:
-                    pass
-                
-                # Unbind all events to prevent callbacks during destruction
-                try:
-                    self.root.unbind('<Button-1>')
-                    self.root.unbind('<B1-Motion>')
-                    self.root.unbind('<Double-Button-1>')
-                    self.root.unbind('<Escape>')
-                    
-                    # Clear any widget-specific bindings
-                    if hasattr(self, 'talk_button'):
-                        self.talk_button.unbind('<ButtonPress-1>')
-                        self.talk_button.unbind('<ButtonRelease-1>')
-                        
-                except tk.TclError:
-                    pass  # Window already destroyed
-                
-                # Destroy the window
-                self.root.destroy()
-                print("UI destroyed successfully")
-                
-        except tk.TclError as e:
-            print(f"Tkinter error during UI cleanup: {e}")
-        except Exception as e:
-            print(f"Error during UI cleanup: {e}")
-            # Force quit if normal cleanup fails
-            try:
-                if hasattr(self, 'root') and self.root:
-                    self.root.quit()
-            except (tk.TclError, AttributeError):
-                pass  # Window already destroyed or doesn't exist 
\ No newline at end of file
+            self.root.destroy()
+        except tk.TclError:
+            pass  # Window already destroyed